@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timedelta
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Response, Cookie
@@ -11,9 +12,10 @@ from app.core.auth import (
     authenticate_user,
     create_access_token,
     get_current_user,
+    get_user_by_username,
     ACCESS_TOKEN_EXPIRE_MINUTES,
-    verify_password,
-    get_password_hash,
+    averify_password,
+    aget_password_hash,
     decode_access_token
 )
 
@@ -59,7 +61,7 @@ async def login(
     db: Session = Depends(get_db)
 ):
     """Login endpoint that returns JWT token and sets HTTP-only cookie."""
-    user = authenticate_user(db, form_data.username, form_data.password)
+    user = await authenticate_user(db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -155,7 +157,7 @@ async def verify_recovery_pin(
             detail="User not found or not an admin"
         )
     
-    if not verify_password(pin, user.recovery_pin):
+    if not await averify_password(pin, user.recovery_pin):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid recovery PIN"
@@ -186,7 +188,7 @@ async def reset_password(
         )
     
     username = payload.get("sub")
-    user = db.query(User).filter(User.username == username).first()
+    user = get_user_by_username(db, username)
     
     if not user:
         raise HTTPException(
@@ -195,7 +197,7 @@ async def reset_password(
         )
     
     # Update password
-    user.password_hash = get_password_hash(new_password)
+    user.password_hash = await aget_password_hash(new_password)
     db.commit()
     
     return {"message": "Password reset successfully"}
@@ -239,12 +241,16 @@ async def create_initial_admin(
             detail="Username or email already taken"
         )
     
-    # Create admin user
+    # Create admin user (both hashes computed side by side off the event loop)
+    password_hash, recovery_pin_hash = await asyncio.gather(
+        aget_password_hash(admin_data.password),
+        aget_password_hash(admin_data.recovery_pin)
+    )
     admin_user = User(
         username=admin_data.username,
         email=admin_data.email,
-        password_hash=get_password_hash(admin_data.password),
-        recovery_pin=get_password_hash(admin_data.recovery_pin),
+        password_hash=password_hash,
+        recovery_pin=recovery_pin_hash,
         role=UserRole.ADMIN,
         is_active=True,
         is_first_login=False
@@ -14,6 +14,23 @@ import re
 
 logger = logging.getLogger(__name__)
 
+# File path patterns, compiled once - improved patterns
+FILE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    # Absolute Windows paths
+    r'[Ff]:\\[Aa]ssistant\\([^\s\"\']+)',
+    r'[Ff]:/[Aa]ssistant/([^\s\"\']+)',
+    # Quoted paths
+    r'[\'"`]([^\'"`]+\.[a-zA-Z]+)[\'"`]',
+    # Relative paths with folders
+    r'\b([a-zA-Z0-9_\-]+(?:/[a-zA-Z0-9_\-]+)*\.[a-zA-Z]+)\b',
+    # Simple filenames
+    r'\b([a-zA-Z0-9_\-]+\.[a-zA-Z]+)\b',
+    # Directory paths
+    r'\b([a-zA-Z0-9_\-]+(?:/[a-zA-Z0-9_\-]+)+)/?\\b',
+))
+
+SEARCH_TERM_PATTERN = re.compile(r'(?:search|find)\s+(?:for\s+)?[\'"`]?([^\'"`\s]+)[\'"`]?', re.IGNORECASE)
+
 class SelfAwareContextBuilder:
     """Builds context for self-aware mode with enhanced file operations"""
     
@@ -38,33 +55,9 @@ class SelfAwareContextBuilder:
                     commands.append(cmd_type)
                     break
         
-        # Extract file paths - improved patterns
-        file_patterns = [
-            # Absolute Windows paths
-            r'[Ff]:\\[Aa]ssistant\\([^\s\"\']+)',
-            r'[Ff]:/[Aa]ssistant/([^\s\"\']+)',
-            # Quoted paths
-            r'[\'"`]([^\'"`]+\.[a-zA-Z]+)[\'"`]',
-            # Relative paths with folders
-            r'\b([a-zA-Z0-9_\-]+(?:/[a-zA-Z0-9_\-]+)*\.[a-zA-Z]+)\b',
-            # Simple filenames
-            r'\b([a-zA-Z0-9_\-]+\.[a-zA-Z]+)\b',
-            # Directory paths
-            r'\b([a-zA-Z0-9_\-]+(?:/[a-zA-Z0-9_\-]+)+)/?\\b',
-        ]
-        
-        paths = []
-        for pattern in file_patterns:
-            matches = re.findall(pattern, message, re.IGNORECASE)
-            paths.extend(matches)
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_paths = []
-        for path in paths:
-            if path not in seen:
-                seen.add(path)
-                unique_paths.append(path)
+        # Extract file paths, dropping duplicates while preserving order
+        paths = [match for pattern in FILE_PATTERNS for match in pattern.findall(message)]
+        unique_paths = list(dict.fromkeys(paths))
         
         return {
             'commands': list(set(commands)),
@@ -125,7 +118,7 @@ When displaying code, preserve formatting and use appropriate language indicator
         
         elif 'search' in extracted['commands']:
             # Extract search term
-            search_match = re.search(r'(?:search|find)\s+(?:for\s+)?[\'"`]?([^\'"`\s]+)[\'"`]?', message, re.IGNORECASE)
+            search_match = SEARCH_TERM_PATTERN.search(message)
             if search_match:
                 pattern = search_match.group(1)
                 result = reader.search_files(pattern)
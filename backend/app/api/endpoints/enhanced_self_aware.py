@@ -14,6 +14,16 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Patterns that catch file paths, compiled once
+FILE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    # Quoted filenames (single, double, or backticks)
+    r'[\'"`]([^\'"`]+\.[a-zA-Z]+)[\'"`]',
+    # Filenames with paths
+    r'\b([a-zA-Z0-9_\-/\\]+\.[a-zA-Z]+)\b',
+    # Simple filenames with underscore
+    r'\b([a-zA-Z0-9_\-]+\.[a-zA-Z]+)\b',
+))
+
 def extract_file_requests(message: str) -> Dict[str, Any]:
     """Extract file paths and commands from user message"""
     message_lower = message.lower()
@@ -22,20 +32,9 @@ def extract_file_requests(message: str) -> Dict[str, Any]:
     file_commands = ['read', 'show', 'display', 'view', 'cat', 'open', 'list', 'ls']
     has_file_command = any(cmd in message_lower for cmd in file_commands)
     
-    # Improved patterns to catch file paths
-    file_patterns = [
-        # Quoted filenames (single, double, or backticks)
-        r'[\'"`]([^\'"`]+\.[a-zA-Z]+)[\'"`]',
-        # Filenames with paths
-        r'\b([a-zA-Z0-9_\-/\\]+\.[a-zA-Z]+)\b',
-        # Simple filenames with underscore
-        r'\b([a-zA-Z0-9_\-]+\.[a-zA-Z]+)\b',
-    ]
-    
     found_files = []
-    for pattern in file_patterns:
-        matches = re.findall(pattern, message, re.IGNORECASE)
-        found_files.extend(matches)
+    for pattern in FILE_PATTERNS:
+        found_files.extend(pattern.findall(message))
     
     # Remove duplicates while preserving order
     seen = set()
@@ -1,5 +1,6 @@
 import os
 import shutil
+import asyncio
 import logging
 from typing import Any, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query, BackgroundTasks
@@ -24,6 +25,20 @@ logger = logging.getLogger(__name__)
 UPLOAD_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), "data", "uploads")
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
+# Buffer size for copying uploads to disk
+UPLOAD_COPY_CHUNK = 64 * 1024
+
+def _copy_upload(file: UploadFile, filepath: str) -> None:
+    with open(filepath, "wb") as f:
+        shutil.copyfileobj(file.file, f, UPLOAD_COPY_CHUNK)
+
+async def save_upload(file: UploadFile, filepath: str) -> None:
+    """
+    Stream an upload's spooled temp file to disk in 64 KB chunks, in a worker
+    thread so large files don't block the event loop.
+    """
+    await asyncio.to_thread(_copy_upload, file, filepath)
+
 # Define function for background processing of documents
 async def process_document_background(db: Session, document_id: str, filepath: Optional[str] = None, filename: Optional[str] = None, filetype: Optional[str] = None, chunk_size: Optional[int] = None, chunk_overlap: Optional[int] = None, use_auto_chunking: bool = True):
     """Background task to process a document and generate embeddings."""
@@ -382,10 +397,7 @@ async def direct_upload(
         
         # Save file to disk
         filepath = os.path.join(upload_dir, storage_filename)
-        with open(filepath, "wb") as f:
-            # Read the file in chunks
-            for chunk in iter(lambda: file.file.read(8192), b""):
-                f.write(chunk)
+        await save_upload(file, filepath)
         
         # Get file size and type
         filesize = os.path.getsize(filepath)
@@ -479,10 +491,8 @@ async def upload_file(
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
         
-        with open(filepath, "wb") as f:
-            # Read the file in chunks to handle large files
-            for chunk in iter(lambda: file.file.read(8192), b""):
-                f.write(chunk)
+        # Stream to disk in chunks to handle large files
+        await save_upload(file, filepath)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to save file: {str(e)}")
     
@@ -7,6 +7,8 @@ from typing import Optional, List, Dict, Any
 import os
 import uuid
 import json
+import shutil
+import asyncio
 
 router = APIRouter()
 
@@ -39,10 +41,11 @@ async def simple_upload(
             # Create directory if it doesn't exist
             os.makedirs(os.path.dirname(filepath), exist_ok=True)
             
-            with open(filepath, "wb") as f:
-                # Read the file in chunks to handle large files
-                for chunk in iter(lambda: file.file.read(8192), b""):
-                    f.write(chunk)
+            # Stream to disk in 64 KB chunks, off the event loop
+            def copy_to_disk():
+                with open(filepath, "wb") as f:
+                    shutil.copyfileobj(file.file, f, 64 * 1024)
+            await asyncio.to_thread(copy_to_disk)
         except Exception as e:
             return {"error": f"Failed to save file: {str(e)}", "status": "failed"}
         
@@ -4,16 +4,19 @@ Enforces F:\\ drive restrictions and requires approval for all writes.
 """
 import os
 import re
+import mimetypes
 import shutil
 import subprocess
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Iterator
 from fastapi import HTTPException
 import logging
 
 logger = logging.getLogger(__name__)
 
+STREAM_CHUNK_SIZE = 64 * 1024  # 64KB chunks for streamed reads
+
 class SecureFileOperations:
     def __init__(self):
         # Only allow writes to F: drive
@@ -130,6 +133,28 @@ class SecureFileOperations:
         except Exception as e:
             raise HTTPException(status_code=404, detail=f"Could not read file: {str(e)}")
     
+    def stream_file(self, filepath: str, chunk_size: int = STREAM_CHUNK_SIZE) -> Tuple[Iterator[bytes], str]:
+        """Prepare a file for chunked reading (no approval needed for reads).
+        
+        The path is checked up front so a missing file raises 404 before any
+        response is started. The file itself is only opened once the response
+        iterates, so a response that is never sent cannot leak the handle.
+        Returns the chunk iterator and the file's guessed media type.
+        """
+        normalized = self.normalize_path(filepath)
+        
+        if not os.path.isfile(normalized) or not os.access(normalized, os.R_OK):
+            raise HTTPException(status_code=404, detail=f"Could not read file: {filepath}")
+        
+        media_type = mimetypes.guess_type(normalized)[0] or "application/octet-stream"
+        return self._iter_chunks(normalized, chunk_size), media_type
+    
+    @staticmethod
+    def _iter_chunks(path: str, chunk_size: int) -> Iterator[bytes]:
+        with open(path, 'rb') as handle:
+            while chunk := handle.read(chunk_size):
+                yield chunk
+    
     async def write_file(self, filepath: str, content: str, action_id: str) -> dict:
         """Write a file (requires prior approval via action_id)."""
         normalized = self.normalize_path(filepath)
@@ -5,8 +5,8 @@ Handles password verification for enabling write permissions.
 import os
 import secrets
 from datetime import datetime, timedelta
-from typing import Dict
-from fastapi import APIRouter, HTTPException, Depends
+from typing import Dict, Tuple
+from fastapi import APIRouter, HTTPException, Depends, Header
 from pydantic import BaseModel
 import logging
 
@@ -115,4 +115,13 @@ def get_current_session(token: str) -> dict:
         del active_sessions[token]
         raise HTTPException(status_code=401, detail="Session expired")
     
-    return session
\ No newline at end of file
+    return session
+
+def get_session_from_auth(authorization: str = Header(...)) -> Tuple[str, dict]:
+    """
+    Dependency resolving the Authorization header to (token, session).
+    FastAPI caches dependency results per request, so the session lookup
+    (and its expired-session sweep) runs once per request.
+    """
+    token = authorization.removeprefix("Bearer ")
+    return token, get_current_session(token)
\ No newline at end of file
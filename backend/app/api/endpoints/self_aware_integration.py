@@ -3,7 +3,9 @@ Integration layer for self-aware mode in chat system.
 Parses AI responses for file operations and command requests.
 """
 import re
+import heapq
 import json
+import shlex
 from typing import Optional, Dict, List, Tuple
 import logging
 
@@ -32,68 +34,113 @@ class SelfAwareResponseParser:
             # Match command blocks
             r'```(?:bash|sh|shell|cmd)\n(.*?)```',
         ]
+        
+        # Fuse each pattern family into one alternation so the response is
+        # scanned once per family instead of once per pattern. The families
+        # stay separate so a command branch can never claim text a file write
+        # branch would match; each compiled family maps to the builder that
+        # turns its matches into actions.
+        self._action_builders = {
+            self._combine_patterns(
+                self.file_write_patterns, 'write', re.MULTILINE | re.DOTALL | re.IGNORECASE
+            ): self._build_file_write_action,
+            self._combine_patterns(
+                self.command_patterns, 'cmd', re.MULTILINE
+            ): self._build_command_action,
+        }
+        
+        # Approval status line per action type, filled from the action dict
+        self.approval_line_templates = {
+            'file_write': "**File Write Request**: `{filepath}`",
+            'command': "**Command Execution Request**: `{command_str}`",
+        }
+        
+        # Phrases marking code/commands as illustrative rather than actionable.
+        # Matched case-insensitively in a single pass over the text.
+        self._example_code_regex = self._compile_indicators([
+            'example', 'sample', 'like this', 'for instance',
+            'you could', 'would look like', 'might look like'
+        ])
+        self._example_command_regex = self._compile_indicators([
+            'example:', 'like:', 'such as:',
+            '<your', '<path', '<file',
+            'your-', 'path/', 'file.'
+        ])
+    
+    @staticmethod
+    def _compile_indicators(indicators: List[str]) -> "re.Pattern":
+        """Compile literal indicator phrases into one case-insensitive matcher."""
+        return re.compile("|".join(map(re.escape, indicators)), re.IGNORECASE)
+    
+    @staticmethod
+    def _combine_patterns(patterns: List[str], prefix: str, flags: int) -> "re.Pattern":
+        """Compile a list of patterns into a single named-group alternation."""
+        return re.compile(
+            "|".join(f"(?P<{prefix}{i}>{pattern})" for i, pattern in enumerate(patterns)),
+            flags
+        )
+    
+    @staticmethod
+    def _branch_group(match: "re.Match", offset: int) -> str:
+        """Return a capture group relative to the matched alternation branch."""
+        return match.group(match.re.groupindex[match.lastgroup] + offset)
     
     def parse_response(self, ai_response: str, session_token: str) -> List[Dict]:
         """Parse AI response for actions that need approval."""
         actions = []
         
-        # Check for file write operations
-        for pattern in self.file_write_patterns:
-            matches = re.finditer(pattern, ai_response, re.MULTILINE | re.DOTALL | re.IGNORECASE)
-            for match in matches:
-                filepath = match.group(1)
-                content = match.group(2).strip()
-                
-                # Skip if it's just an example
-                if self._is_example_code(filepath, content):
-                    continue
-                
-                actions.append({
-                    'type': 'file_write',
-                    'filepath': filepath,
-                    'content': content,
-                    'reason': f'AI wants to write/update {filepath}',
-                    'session_token': session_token
-                })
-        
-        # Check for command execution requests
-        for pattern in self.command_patterns:
-            matches = re.finditer(pattern, ai_response, re.MULTILINE)
-            for match in matches:
-                command_str = match.group(1).strip()
-                
-                # Skip if it's just an example
-                if self._is_example_command(command_str):
-                    continue
-                
-                # Parse command into list
-                command_list = self._parse_command_string(command_str)
-                
-                actions.append({
-                    'type': 'command',
-                    'command': command_list,
-                    'command_str': command_str,
-                    'reason': f'AI wants to execute: {command_str}',
-                    'session_token': session_token
-                })
+        # Literal pre-scan: every pattern needs a backtick, or a '$'/'>' prompt
+        # marker, so plain chatty responses skip the regex engine entirely
+        if '`' not in ai_response and '$' not in ai_response and '>' not in ai_response:
+            return actions
+        
+        # Each family yields matches in order; merge them by position
+        family_matches = (regex.finditer(ai_response) for regex in self._action_builders)
+        for match in heapq.merge(*family_matches, key=lambda m: m.start()):
+            action = self._action_builders[match.re](match, session_token)
+            if action is not None:
+                actions.append(action)
         
         return actions
     
+    def _build_file_write_action(self, match: "re.Match", session_token: str) -> Optional[Dict]:
+        """Build a file write action from a match, or None for example code."""
+        filepath = self._branch_group(match, 1)
+        content = self._branch_group(match, 2).strip()
+        
+        # Skip if it's just an example
+        if self._is_example_code(filepath, content):
+            return None
+        
+        return {
+            'type': 'file_write',
+            'filepath': filepath,
+            'content': content,
+            'reason': f'AI wants to write/update {filepath}',
+            'session_token': session_token
+        }
+    
+    def _build_command_action(self, match: "re.Match", session_token: str) -> Optional[Dict]:
+        """Build a command action from a match, or None for example commands."""
+        command_str = self._branch_group(match, 1).strip()
+        
+        # Skip if it's just an example
+        if self._is_example_command(command_str):
+            return None
+        
+        return {
+            'type': 'command',
+            'command': self._parse_command_string(command_str),
+            'command_str': command_str,
+            'reason': f'AI wants to execute: {command_str}',
+            'session_token': session_token
+        }
+    
     def _is_example_code(self, filepath: str, content: str) -> bool:
         """Check if this is just example code, not meant to be written."""
-        example_indicators = [
-            'example', 'Example', 'EXAMPLE',
-            'sample', 'Sample', 'SAMPLE',
-            'like this', 'Like this',
-            'for instance', 'For instance',
-            'you could', 'You could',
-            'would look like', 'might look like'
-        ]
-        
         # Check if filepath contains example indicators
-        for indicator in example_indicators:
-            if indicator in filepath:
-                return True
+        if self._example_code_regex.search(filepath):
+            return True
         
         # Check if content is very short (likely just a snippet)
         if len(content) < 50:
@@ -103,28 +150,14 @@ class SelfAwareResponseParser:
     
     def _is_example_command(self, command: str) -> bool:
         """Check if this is just an example command."""
-        example_indicators = [
-            'example:', 'Example:',
-            'like:', 'Like:',
-            'such as:', 'Such as:',
-            '<your', '<path', '<file',
-            'your-', 'path/', 'file.'
-        ]
-        
-        for indicator in example_indicators:
-            if indicator in command:
-                return True
-        
-        return False
+        return self._example_command_regex.search(command) is not None
     
     def _parse_command_string(self, command_str: str) -> List[str]:
         """Parse command string into list of arguments."""
-        # Simple parsing - can be enhanced with shlex for more complex cases
-        import shlex
         try:
             return shlex.split(command_str)
-        except:
-            # Fallback to simple split
+        except ValueError:
+            # Unbalanced quotes - fall back to simple split
             return command_str.split()
     
     def inject_approval_status(self, response: str, pending_actions: List[Dict]) -> str:
@@ -132,17 +165,16 @@ class SelfAwareResponseParser:
         if not pending_actions:
             return response
         
-        status_message = "\n\n---\n🔴 **SELF-AWARE MODE - APPROVAL REQUIRED**\n\n"
+        parts = [response, "\n\n---\n🔴 **SELF-AWARE MODE - APPROVAL REQUIRED**\n\n"]
         
         for i, action in enumerate(pending_actions, 1):
-            if action['type'] == 'file_write':
-                status_message += f"{i}. **File Write Request**: `{action['filepath']}`\n"
-            elif action['type'] == 'command':
-                status_message += f"{i}. **Command Execution Request**: `{action['command_str']}`\n"
+            template = self.approval_line_templates.get(action['type'])
+            if template:
+                parts.append(f"{i}. {template.format_map(action)}\n")
         
-        status_message += "\nThese actions require your approval. You will see approval prompts shortly.\n"
+        parts.append("\nThese actions require your approval. You will see approval prompts shortly.\n")
         
-        return response + status_message
+        return "".join(parts)
 
 # Global instance
 response_parser = SelfAwareResponseParser()
\ No newline at end of file
@@ -4,14 +4,15 @@ Integrates with the approval queue for all write operations.
 """
 import os
 import json
-from typing import Optional, Dict
-from fastapi import APIRouter, HTTPException, Header
+from typing import Optional, Dict, Tuple
+from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 import logging
 
 from .action_approval import approval_queue
 from .secure_file_ops import secure_file_ops
-from .self_aware_auth import get_current_session
+from .self_aware_auth import get_session_from_auth
 
 logger = logging.getLogger(__name__)
 
@@ -29,18 +30,17 @@ class CommandExecuteRequest(BaseModel):
 
 class FileReadRequest(BaseModel):
     filepath: str
+    stream: bool = False  # Stream raw file bytes instead of a JSON payload
 
 @router.post("/write-file")
 async def write_file_with_approval(
     request: FileWriteRequest,
-    authorization: str = Header(...)
+    auth: Tuple[str, dict] = Depends(get_session_from_auth)
 ):
     """
     Request to write a file. Requires approval before execution.
     """
-    # Extract token from header
-    token = authorization.replace("Bearer ", "")
-    session = get_current_session(token)
+    token, session = auth
     
     if not session.get('write_permissions'):
         raise HTTPException(status_code=403, detail="No write permissions")
@@ -83,14 +83,12 @@ async def write_file_with_approval(
 @router.post("/execute-command")
 async def execute_command_with_approval(
     request: CommandExecuteRequest,
-    authorization: str = Header(...)
+    auth: Tuple[str, dict] = Depends(get_session_from_auth)
 ):
     """
     Request to execute a command. Requires approval before execution.
     """
-    # Extract token from header
-    token = authorization.replace("Bearer ", "")
-    session = get_current_session(token)
+    token, session = auth
     
     if not session.get('write_permissions'):
         raise HTTPException(status_code=403, detail="No write permissions")
@@ -132,14 +130,18 @@ async def execute_command_with_approval(
 @router.post("/read-file")
 async def read_file_no_approval(
     request: FileReadRequest,
-    authorization: str = Header(...)
+    auth: Tuple[str, dict] = Depends(get_session_from_auth)
 ):
     """
     Read a file. No approval needed for read operations.
+    Set stream=true to receive the raw file in 64KB chunks instead of JSON.
     """
-    # Extract token from header
-    token = authorization.replace("Bearer ", "")
-    session = get_current_session(token)
+    token, session = auth
+    
+    if request.stream:
+        # Sync iterator is consumed in Starlette's threadpool, off the event loop
+        chunks, media_type = secure_file_ops.stream_file(request.filepath)
+        return StreamingResponse(chunks, media_type=media_type)
     
     # Read is allowed in self-aware mode
     content = await secure_file_ops.read_file(request.filepath)
@@ -153,14 +155,12 @@ async def read_file_no_approval(
 @router.get("/audit-log")
 async def get_audit_log(
     limit: int = 50,
-    authorization: str = Header(...)
+    auth: Tuple[str, dict] = Depends(get_session_from_auth)
 ):
     """
     Get the audit log of all approved/denied actions.
     """
-    # Extract token from header
-    token = authorization.replace("Bearer ", "")
-    session = get_current_session(token)
+    token, session = auth
     
     # Return action history
     history = await approval_queue.get_action_history(limit)
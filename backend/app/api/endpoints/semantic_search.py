@@ -1,3 +1,4 @@
+import re
 from typing import Any, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Body
 from sqlalchemy.orm import Session
@@ -5,9 +6,25 @@ from pydantic import BaseModel
 
 from ...db.database import get_db
 from ...rag.vector_store import get_vector_store
+from ...services.embedding_service import get_embedding_service
 
 router = APIRouter()
 
+# Whitespace-delimited word, used for the approximate context token count
+WORD_PATTERN = re.compile(r"\S+")
+
+# Embedding service shared across requests. get_embedding_service() runs a
+# blocking NIM health probe, so it is only called until the first success.
+_embedding_service = None
+
+
+def _get_embedding_service():
+    """Return the process-wide embedding service, creating it on first use."""
+    global _embedding_service
+    if _embedding_service is None:
+        _embedding_service = get_embedding_service()
+    return _embedding_service
+
 
 class SemanticSearchRequest(BaseModel):
     """Schema for semantic search requests."""
@@ -38,10 +55,8 @@ async def semantic_search(
     Perform a semantic search using vector embeddings.
     """
     try:
-        # Get embedding service and vector store
-        from ...services.embedding_service import get_embedding_service
-        embedding_service = get_embedding_service()
-        vector_store = get_vector_store(db, embedding_service)
+        # Vector store binds to the request's DB session; embedding service is shared
+        vector_store = get_vector_store(db, _get_embedding_service())
         
         # Generate embedding for the query
         query_embedding = await vector_store.generate_embedding(search_request.query)
@@ -54,23 +69,21 @@ async def semantic_search(
             similarity_threshold=search_request.similarity_threshold
         )
         
-        # Convert to response model
-        search_results = []
-        for result in results:
-            search_results.append(
-                SearchResult(
-                    document_id=result["document_id"],
-                    chunk_id=result["chunk_id"],
-                    content=result["content"],
-                    similarity=float(result["similarity"]),
-                    filename=result["filename"],
-                    filetype=result["filetype"],
-                    chunk_index=result["chunk_index"],
-                    meta_data=result.get("meta_data")
-                )
+        # Convert to response model. Rows come straight from our own query, so
+        # skip per-row validation; response_model still validates the output.
+        return [
+            SearchResult.model_construct(
+                document_id=result["document_id"],
+                chunk_id=result["chunk_id"],
+                content=result["content"],
+                similarity=float(result["similarity"]),
+                filename=result["filename"],
+                filetype=result["filetype"],
+                chunk_index=result["chunk_index"],
+                meta_data=result.get("meta_data")
             )
-        
-        return search_results
+            for result in results
+        ]
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error performing semantic search: {str(e)}")
@@ -87,10 +100,8 @@ async def get_chat_context(
     Get relevant document chunks as context for a chat message.
     """
     try:
-        # Get embedding service and vector store
-        from ...services.embedding_service import get_embedding_service
-        embedding_service = get_embedding_service()
-        vector_store = get_vector_store(db, embedding_service)
+        # Vector store binds to the request's DB session; embedding service is shared
+        vector_store = get_vector_store(db, _get_embedding_service())
         
         # Generate embedding for the query
         query_embedding = await vector_store.generate_embedding(query)
@@ -103,21 +114,23 @@ async def get_chat_context(
             similarity_threshold=0.7
         )
         
-        # Format results for context
-        context_chunks = []
-        for result in results:
-            # Format each chunk as a context snippet
-            context_chunks.append({
+        # Format each chunk as a context snippet
+        context_chunks = [
+            {
                 "content": result["content"],
                 "source": result["filename"],
                 "similarity": float(result["similarity"]),
                 "document_id": result["document_id"],
                 "chunk_id": result["chunk_id"],
-            })
+            }
+            for result in results
+        ]
         
         return {
             "context_chunks": context_chunks,
-            "context_token_count": sum(len(c["content"].split()) for c in context_chunks)
+            "context_token_count": sum(
+                1 for c in context_chunks for _ in WORD_PATTERN.finditer(c["content"])
+            )
         }
     
     except Exception as e:
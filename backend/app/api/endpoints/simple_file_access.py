@@ -6,23 +6,46 @@ and only works in self-aware context mode.
 Simplified file access for the AI assistant - works in ANY context
 """
 import re
+import asyncio
 import logging
 from typing import Dict, Any
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
-def inject_file_content_if_requested(message: str) -> str:
+# Quick check if a message might be a file request
+FILE_INDICATOR_PATTERN = re.compile(r'read|show|display|file|\.(?:py|md|txt|js|ts)', re.IGNORECASE)
+
+# File references in a message, as one alternation: explicit read verbs,
+# quoted names, then bare path-like tokens. Exactly one group is set per match.
+FILE_REFERENCE_PATTERN = re.compile(
+    r'(?:read|show|display|view|cat|open)\s+[\'"`]?([^\s\'"`]+\.[a-zA-Z]+)[\'"`]?'
+    r'|[\'"`]([^\'"`]+\.[a-zA-Z]+)[\'"`]'
+    r'|\b([a-zA-Z0-9_\-/\\]+\.[a-zA-Z]+)\b',
+    re.IGNORECASE
+)
+
+# File extension -> code block language for syntax highlighting
+LANGUAGE_MAP = {
+    '.py': 'python', '.js': 'javascript', '.ts': 'typescript',
+    # Use 'plaintext' for markdown and text files to ensure they display in code blocks
+    '.md': 'plaintext', '.txt': 'plaintext', '.json': 'json',
+    '.yml': 'yaml', '.yaml': 'yaml', '.sh': 'bash'
+}
+
+async def inject_file_content_if_requested(message: str) -> str:
     """
     Check if user is asking for files and inject content directly.
     Works in ANY context mode for simplicity.
     """
     logger.info(f"Checking message for file requests: {message}")
-    message_lower = message.lower()
+    
+    # Every file reference pattern requires an extension dot
+    if "." not in message:
+        return ""
     
     # Quick check if this might be a file request
-    file_indicators = ['read', 'show', 'display', 'file', '.py', '.md', '.txt', '.js', '.ts']
-    has_indicator = any(indicator in message_lower for indicator in file_indicators)
+    has_indicator = FILE_INDICATOR_PATTERN.search(message) is not None
     logger.info(f"Has file indicator: {has_indicator}")
     
     if not has_indicator:
@@ -36,47 +59,37 @@ def inject_file_content_if_requested(message: str) -> str:
         logger.error(f"Failed to import file reader: {e}")
         return ""
     
-    # Find file references in the message
-    file_patterns = [
-        r'(?:read|show|display|view|cat|open)\s+[\'"`]?([^\s\'"`]+\.[a-zA-Z]+)[\'"`]?',
-        r'[\'"`]([^\'"`]+\.[a-zA-Z]+)[\'"`]',
-        r'\b([a-zA-Z0-9_\-/\\]+\.[a-zA-Z]+)\b',
-    ]
-    
+    # Find file references in the message, removing duplicates in order
+    seen = set()
     found_files = []
-    for pattern in file_patterns:
-        matches = re.findall(pattern, message, re.IGNORECASE)
-        found_files.extend(matches)
-    
-    # Remove duplicates
-    found_files = list(dict.fromkeys(found_files))
+    for match in FILE_REFERENCE_PATTERN.finditer(message):
+        file_path = match.group(match.lastindex)
+        if '\\' in file_path:
+            file_path = file_path.replace('\\', '/')
+        if file_path not in seen:
+            seen.add(file_path)
+            found_files.append(file_path)
     
     if not found_files:
         return ""
     
-    # Read files and build context
+    # Read all files concurrently in worker threads; gather preserves order
+    logger.info(f"Attempting to read: {found_files}")
+    results = await asyncio.gather(
+        *(asyncio.to_thread(file_reader.read_file, file_path) for file_path in found_files)
+    )
+    
+    # Build context
     file_contents = []
-    for file_path in found_files:
-        file_path = file_path.replace('\\', '/')
-        logger.info(f"Attempting to read: {file_path}")
-        
-        result = file_reader.read_file(file_path)
+    for file_path, result in zip(found_files, results):
         if result["success"]:
             # Determine language for syntax highlighting
             ext = Path(file_path).suffix.lower()
-            lang_map = {
-                '.py': 'python', '.js': 'javascript', '.ts': 'typescript',
-                # Use 'plaintext' for markdown and text files to ensure they display in code blocks
-                '.md': 'plaintext', '.txt': 'plaintext', '.json': 'json',
-                '.yml': 'yaml', '.yaml': 'yaml', '.sh': 'bash'
-            }
-            lang = lang_map.get(ext, 'plaintext')
+            lang = LANGUAGE_MAP.get(ext, 'plaintext')
             
-            file_contents.append(f"\n=== FILE: {file_path} ===")
-            file_contents.append(f"```{lang}")
-            file_contents.append(result["content"])
-            file_contents.append("```")
-            file_contents.append("=" * 60)
+            file_contents.append(
+                f"\n=== FILE: {file_path} ===\n```{lang}\n{result['content']}\n```\n{'=' * 60}"
+            )
             
             logger.info(f"Successfully read {file_path}: {len(result['content'])} chars")
         else:
@@ -1,127 +1,485 @@
 from fastapi import APIRouter, HTTPException, BackgroundTasks, WebSocket, WebSocketDisconnect
-from typing import List, Dict, Any, Optional
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel, ConfigDict
+from typing import List, Dict, Any, Optional, Tuple, Callable, Awaitable, NamedTuple, Iterator, Set, Mapping
 import psutil
 import subprocess
 import platform
 import sys
 import os
 import signal
+import socket
 import time
 from datetime import datetime
 import logging
 import httpx
+import orjson
 import asyncio
 import json
-import torch
+import re
+from types import MappingProxyType
+from importlib.metadata import version as package_version, PackageNotFoundError
 
 from app.services.model_orchestrator import orchestrator, OperationalMode, ModelStatus
+from app.core import gpu_monitor
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# WebSocket connections for real-time updates
-active_connections: List[WebSocket] = []
+# WebSocket connections for real-time updates; fed by one shared
+# orchestrator callback rather than a callback per connection
+active_connections: Set[WebSocket] = set()
+# /ws/system-status subscribers; one status build per interval is shared by all
+status_connections: Set[WebSocket] = set()
+# A background task rebuilds the status snapshot on this interval; GET /status
+# and the WebSocket serve the latest serialized snapshot
+STATUS_REFRESH_INTERVAL = 5  # seconds
+_latest_status: Optional[bytes] = None
 
 # Store for tracking service states
 service_states = {}
 
-class ServiceStatus:
-    def __init__(self, name: str, status: str, version: Optional[str] = None, 
-                 port: Optional[int] = None, pid: Optional[int] = None,
-                 uptime: Optional[str] = None, memory_usage: Optional[float] = None,
-                 cpu_usage: Optional[float] = None):
-        self.name = name
-        self.status = status
-        self.version = version
-        self.port = port
-        self.pid = pid
-        self.uptime = uptime
-        self.memory_usage = memory_usage
-        self.cpu_usage = cpu_usage
-
-class ModelInfo:
-    def __init__(self, name: str, type: str, status: str, size: Optional[str] = None,
-                 parameters: Optional[str] = None, quantization: Optional[str] = None,
-                 memory_usage: Optional[float] = None, context_length: Optional[int] = None,
-                 last_used: Optional[str] = None):
-        self.name = name
-        self.type = type
-        self.status = status
-        self.size = size
-        self.parameters = parameters
-        self.quantization = quantization
-        self.memory_usage = memory_usage
-        self.context_length = context_length
-        self.last_used = last_used
-
-class EnvironmentInfo:
-    def __init__(self, python_version: str, node_version: str, cuda_version: Optional[str] = None,
-                 pytorch_version: Optional[str] = None, tensorflow_version: Optional[str] = None,
-                 pgvector_version: Optional[str] = None, os_info: str = "",
-                 total_memory: int = 0, available_memory: int = 0, gpu_info: Optional[Dict] = None):
-        self.python_version = python_version
-        self.node_version = node_version
-        self.cuda_version = cuda_version
-        self.pytorch_version = pytorch_version
-        self.tensorflow_version = tensorflow_version
-        self.pgvector_version = pgvector_version
-        self.os_info = os_info
-        self.total_memory = total_memory
-        self.available_memory = available_memory
-        self.gpu_info = gpu_info
+# Short-lived cache for expensive status probes: {key: (expires_at, value)}.
+# Frontend polling within the TTL is served from memory instead of re-running
+# psutil scans and subprocesses.
+PROBE_CACHE_DURATION = 3  # seconds
+# Per-section lifetimes for /status: uptime and CPU move quickly, the model
+# list rarely changes, memory and GPU stats sit in between
+SERVICES_CACHE_DURATION = 3  # seconds
+MODELS_CACHE_DURATION = 10  # seconds
+ENVIRONMENT_CACHE_DURATION = 5  # seconds
+OLLAMA_HEALTH_CACHE_DURATION = 5  # seconds
+_probe_cache: Dict[str, Tuple[float, Any]] = {}
+_probe_locks: Dict[str, asyncio.Lock] = {}
+
+# How often the background task refreshes the installed Ollama model list
+OLLAMA_BASE_URL = "http://localhost:11434"
+OLLAMA_REFRESH_INTERVAL = 10  # seconds
+_background_tasks: List[asyncio.Task] = []
+# When both the HTTP API and the CLI fail, skip probing Ollama until this
+# monotonic deadline instead of waiting out timeouts on every refresh
+OLLAMA_DOWN_BACKOFF = 30  # seconds
+_ollama_down_until = 0.0
+
+# Shared client for local service probes (Ollama, NIM). Reusing it keeps
+# connections alive between polls; it is closed on application shutdown.
+http_client = httpx.AsyncClient(
+    timeout=3.0,
+    limits=httpx.Limits(max_keepalive_connections=8, max_connections=16, keepalive_expiry=60)
+)
+
+# Process handles reused across calls; cpu_percent(interval=None) measures
+# against the previous call on the same handle
+_tracked_processes: Dict[int, psutil.Process] = {}
+# is_running() re-reads the process to detect PID reuse, doubling the cost of
+# a poll; handles are re-verified at most this often: {pid: verified_at}
+PROCESS_VERIFY_INTERVAL = 30  # seconds
+_process_verified_at: Dict[int, float] = {}
+
+# Minimum spacing between CPU samples of one process; faster polls reuse the
+# last value instead of measuring a near-zero interval: {pid: (sampled_at, percent)}
+CPU_SAMPLE_MIN_INTERVAL = 1.0  # seconds
+_cpu_samples: Dict[int, Tuple[float, float]] = {}
+
+# On Linux, tracked processes are read straight from /proc/<pid>/stat.
+# Per-PID CPU baseline: {pid: (create_time, sampled_at, cpu_ticks, percent)}
+IS_LINUX = sys.platform.startswith('linux')
+if IS_LINUX:
+    CLK_TCK = os.sysconf('SC_CLK_TCK')
+    PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+    BOOT_TIME = psutil.boot_time()
+_proc_stat_samples: Dict[int, Tuple[float, float, int, float]] = {}
+# Open /proc/<pid>/stat descriptors, re-read with pread on every refresh
+_proc_stat_fds: Dict[int, int] = {}
+PROC_STAT_READ_SIZE = 4096
+
+# Platform facts fixed for the lifetime of the process
+IS_WINDOWS = platform.system() == "Windows"
+PYTHON_VERSION = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+OS_INFO = f"{platform.system()} {platform.release()}"
+
+# Allowlisted service control commands for this platform, keyed by
+# (service, action). Each entry is a sequence of (command, check) steps run
+# in order, with SERVICE_STEP_DELAY seconds between steps.
+if IS_WINDOWS:
+    SERVICE_COMMANDS: Dict[Tuple[str, str], List[Tuple[List[str], bool]]] = {
+        ("PostgreSQL", "start"): [(['net', 'start', 'postgresql-x64-17'], True)],
+        ("PostgreSQL", "stop"): [(['net', 'stop', 'postgresql-x64-17'], True)],
+        ("PostgreSQL", "restart"): [
+            (['net', 'stop', 'postgresql-x64-17'], False),
+            (['net', 'start', 'postgresql-x64-17'], True)
+        ],
+    }
+else:
+    SERVICE_COMMANDS = {
+        ("PostgreSQL", "start"): [(['sudo', 'systemctl', 'start', 'postgresql'], True)],
+        ("PostgreSQL", "stop"): [(['sudo', 'systemctl', 'stop', 'postgresql'], True)],
+        ("PostgreSQL", "restart"): [(['sudo', 'systemctl', 'restart', 'postgresql'], True)],
+    }
+SERVICE_STEP_DELAY = 2  # seconds
+SERVICE_CONTROL_TIMEOUT = 60  # seconds per command
+SERVICE_ACTION_PAST_TENSE = {"start": "started", "stop": "stopped", "restart": "restarted"}
+
+# One `ollama list` row: NAME, ID, SIZE... (columns never span lines)
+OLLAMA_LIST_ROW_PATTERN = re.compile(rb"^(\S+)[ \t]+\S+[ \t]+(\S+)", re.MULTILINE)
+
+# "Cuda compilation tools, release 12.2, V12.2.140" in `nvcc --version` output
+CUDA_RELEASE_PATTERN = re.compile(rb"release\s+(\d+\.\d+)")
+
+# Last status timestamp as (epoch second, ISO string), formatted once per second
+_last_timestamp: Tuple[int, str] = (0, "")
+
+class ServiceStatus(BaseModel):
+    name: str
+    status: str
+    version: Optional[str] = None
+    port: Optional[int] = None
+    pid: Optional[int] = None
+    uptime: Optional[str] = None
+    memory_usage: Optional[float] = None
+    cpu_usage: Optional[float] = None
+
+class ModelInfo(BaseModel):
+    name: str
+    type: str
+    status: str
+    size: Optional[str] = None
+    parameters: Optional[str] = None
+    quantization: Optional[str] = None
+    memory_usage: Optional[float] = None
+    context_length: Optional[int] = None
+    last_used: Optional[str] = None
+
+class EnvironmentInfo(BaseModel):
+    python_version: str
+    node_version: str
+    cuda_version: Optional[str] = None
+    pytorch_version: Optional[str] = None
+    tensorflow_version: Optional[str] = None
+    pgvector_version: Optional[str] = None
+    os_info: str = ""
+    total_memory: int = 0
+    available_memory: int = 0
+    gpu_info: Optional[Dict[str, Any]] = None
+
+class ProcessInfo(NamedTuple):
+    """Per-process resource sample; defaults stand in when the process can't be read"""
+    memory_usage: float = 0  # MB
+    cpu_usage: float = 0
+    create_time: Optional[float] = None
+
+class SystemStatus(BaseModel):
+    services: List[ServiceStatus]
+    models: List[ModelInfo]
+    environment: EnvironmentInfo
+    last_updated: str
+
+class NimModel(BaseModel):
+    """Entry of /models/available-nim-only"""
+    model_config = ConfigDict(extra='forbid', frozen=True)
+    
+    name: str
+    type: str
+    status: str
+    size: str
+    parameters: str
+    quantization: Optional[str] = None
+    memory_usage: Optional[float] = None
+    context_length: Optional[int] = None
+    last_used: Optional[str] = None
+    container: Optional[str] = None
+    port: Optional[int] = None
+    note: Optional[str] = None
+
+class NimStatusEntry(BaseModel):
+    """Per-container entry of /nim/status"""
+    model_config = ConfigDict(extra='forbid')
+    
+    healthy: bool
+    model: str
+    status: str
+
+# /models/available-nim-only entries as reported while the container is
+# down; nim_model_entry() overlays the loaded state when it is healthy
+NIM_GENERATION_MODEL = NimModel(
+    name="meta/llama-3.1-70b-instruct",
+    type="NVIDIA NIM",
+    status="unloaded",
+    size="22GB",
+    parameters="70B",
+    quantization="TensorRT Optimized",
+    memory_usage=0,
+    context_length=131072,
+    last_used="Inactive",
+    container="nim-generation-70b",
+    port=8083
+)
+NIM_GENERATION_MEMORY = 22000  # MB while loaded
+
+NIM_EMBEDDINGS_MODEL = NimModel(
+    name="nvidia/nv-embedqa-e5-v5",
+    type="NVIDIA NIM Embeddings",
+    status="unloaded",
+    size="15GB",
+    parameters="7.9B",
+    memory_usage=0,
+    context_length=32768,
+    last_used="Inactive",
+    container="nim-embeddings",
+    port=8081
+)
+NIM_EMBEDDINGS_MEMORY = 3200  # MB while loaded
+
+NEMO_DOCUMENT_MODEL = NimModel(
+    name="NeMo Document AI",
+    type="Document Processing",
+    status="unloaded",
+    size="2.1GB",
+    parameters="Hierarchical Processing",
+    note="Available for document structure preservation"
+)
+
+async def run_command_async(cmd: List[str], timeout: float = 5) -> subprocess.CompletedProcess:
+    """
+    Run a command without blocking the event loop.
+    Returns a CompletedProcess with raw bytes stdout/stderr; raises
+    subprocess.TimeoutExpired if the command exceeds the timeout.
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+    except NotImplementedError:
+        # Selector event loops on Windows (e.g. uvicorn --reload) cannot spawn
+        # subprocesses, so run the blocking call in a worker thread instead
+        return await asyncio.to_thread(subprocess.run, cmd, capture_output=True, timeout=timeout)
+    
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
+async def get_cached(key: str, producer: Callable[[], Awaitable[Any]],
+                     ttl: float = PROBE_CACHE_DURATION) -> Any:
+    """
+    Return the cached value for key, refreshing it via producer() once the TTL
+    has expired. Concurrent callers on a stale key share a single refresh.
+    """
+    entry = _probe_cache.get(key)
+    if entry and time.monotonic() < entry[0]:
+        return entry[1]
+    
+    async with _probe_locks.setdefault(key, asyncio.Lock()):
+        # Another caller may have refreshed the entry while we waited
+        entry = _probe_cache.get(key)
+        if entry and time.monotonic() < entry[0]:
+            return entry[1]
+        
+        value = await producer()
+        _probe_cache[key] = (time.monotonic() + ttl, value)
+        return value
+
+def _is_listening_on(pid: int, port: int) -> bool:
+    """Check whether a specific process is still listening on a TCP port"""
+    try:
+        return any(
+            conn.laddr.port == port and conn.status == 'LISTEN'
+            for conn in psutil.Process(pid).connections(kind='tcp')
+        )
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return False
+
+def is_port_listening(port: int, timeout: float = 0.1) -> bool:
+    """Cheap liveness check: try a local TCP connect instead of scanning sockets"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        return sock.connect_ex(("127.0.0.1", port)) == 0
 
 def get_process_by_port(port: int) -> Optional[int]:
     """Find process ID by port number"""
+    # Verify the last known listener first; the system-wide connection table
+    # scan is one of psutil's most expensive calls
+    port_pids = service_states.setdefault('port_pids', {})
+    cached_pid = port_pids.get(port)
+    if cached_pid and _is_listening_on(cached_pid, port):
+        return cached_pid
+    
+    port_pids.pop(port, None)
     try:
-        for conn in psutil.net_connections():
+        for conn in psutil.net_connections(kind='tcp'):
             if conn.laddr.port == port and conn.status == 'LISTEN':
+                if conn.pid:
+                    port_pids[port] = conn.pid
                 return conn.pid
     except (psutil.NoSuchProcess, psutil.AccessDenied):
         pass
     return None
 
-def get_process_info(pid: int) -> Dict[str, Any]:
+def get_tracked_process(pid: int) -> psutil.Process:
+    """Return a reusable process handle, replacing it if the PID was recycled"""
+    now = time.monotonic()
+    process = _tracked_processes.get(pid)
+    if process is not None and (
+        pid == os.getpid() or now - _process_verified_at.get(pid, 0) < PROCESS_VERIFY_INTERVAL
+    ):
+        # Our own PID can't be recycled; others were verified recently and a
+        # dead process still raises NoSuchProcess inside oneshot()
+        return process
+    
+    if process is None or not process.is_running():
+        process = psutil.Process(pid)
+        _tracked_processes[pid] = process
+        _cpu_samples.pop(pid, None)
+    _process_verified_at[pid] = now
+    return process
+
+def sample_cpu_percent(process: psutil.Process) -> float:
+    """Non-blocking CPU sample, rate limited to one measurement per interval"""
+    now = time.monotonic()
+    last = _cpu_samples.get(process.pid)
+    if last and now - last[0] < CPU_SAMPLE_MIN_INTERVAL:
+        return last[1]
+    
+    percent = process.cpu_percent(interval=None)
+    _cpu_samples[process.pid] = (now, percent)
+    return percent
+
+def prime_cpu_sampling():
+    """Take baseline CPU samples so the first status poll reports real usage"""
+    for pid in (os.getpid(), get_process_by_port(5432)):
+        if pid and IS_LINUX:
+            get_process_info(pid)
+        elif pid:
+            try:
+                get_tracked_process(pid).cpu_percent(interval=None)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+
+def parse_stat_buffer(buf: bytes) -> Tuple[int, int, float]:
+    """
+    Parse a raw /proc/<pid>/stat buffer into (cpu ticks, rss bytes, create time).
+    The command name may contain spaces or parentheses, so fields are split
+    after the last ')'; fields[0] is then stat field 3 (state).
+    """
+    fields = buf[buf.rfind(b')') + 2:].split()
+    cpu_ticks = int(fields[11]) + int(fields[12])  # utime + stime
+    create_time = BOOT_TIME + int(fields[19]) / CLK_TCK  # starttime
+    rss = int(fields[21]) * PAGE_SIZE
+    return cpu_ticks, rss, create_time
+
+def read_proc_stat(pid: int) -> bytes:
+    """
+    Read /proc/<pid>/stat through a descriptor kept open across refreshes,
+    so each poll costs one pread instead of open/read/close. The descriptor
+    is bound to the original process, so reads fail once it exits.
+    """
+    fd = _proc_stat_fds.get(pid)
+    if fd is None:
+        fd = os.open(f"/proc/{pid}/stat", os.O_RDONLY)
+        _proc_stat_fds[pid] = fd
+    try:
+        return os.pread(fd, PROC_STAT_READ_SIZE, 0)
+    except OSError:
+        close_proc_stat(pid)
+        raise
+
+def close_proc_stat(pid: int):
+    """Close the cached /proc/<pid>/stat descriptor, if any"""
+    fd = _proc_stat_fds.pop(pid, None)
+    if fd is not None:
+        os.close(fd)
+
+def get_process_info_linux(pid: int) -> ProcessInfo:
+    """Get process information from a single /proc/<pid>/stat read"""
+    cpu_ticks, rss, create_time = parse_stat_buffer(read_proc_stat(pid))
+    
+    now = time.monotonic()
+    last = _proc_stat_samples.get(pid)
+    if last is None or last[0] != create_time:
+        # First sample for this process (or the PID was recycled)
+        _proc_stat_samples[pid] = (create_time, now, cpu_ticks, 0.0)
+        percent = 0.0
+    elif now - last[1] < CPU_SAMPLE_MIN_INTERVAL:
+        percent = last[3]
+    else:
+        percent = (cpu_ticks - last[2]) / CLK_TCK / (now - last[1]) * 100
+        _proc_stat_samples[pid] = (create_time, now, cpu_ticks, percent)
+    
+    return ProcessInfo(
+        memory_usage=round(rss / 1024 / 1024, 1),
+        cpu_usage=round(percent, 1),
+        create_time=create_time
+    )
+
+def get_process_info(pid: int) -> ProcessInfo:
     """Get detailed process information"""
+    if IS_LINUX:
+        try:
+            return get_process_info_linux(pid)
+        except (OSError, ValueError, IndexError):
+            close_proc_stat(pid)
+            _proc_stat_samples.pop(pid, None)
+            return ProcessInfo()
+    
     try:
-        process = psutil.Process(pid)
-        return {
-            'memory_usage': round(process.memory_info().rss / 1024 / 1024, 1),  # MB
-            'cpu_usage': round(process.cpu_percent(interval=0.1), 1),
-            'create_time': process.create_time()
-        }
+        process = get_tracked_process(pid)
+        # Read all fields from a single /proc (or Win32) snapshot
+        with process.oneshot():
+            return ProcessInfo(
+                memory_usage=round(process.memory_info().rss / 1024 / 1024, 1),
+                cpu_usage=round(sample_cpu_percent(process), 1),
+                create_time=process.create_time()
+            )
     except (psutil.NoSuchProcess, psutil.AccessDenied):
-        return {}
+        _tracked_processes.pop(pid, None)
+        _process_verified_at.pop(pid, None)
+        _cpu_samples.pop(pid, None)
+        return ProcessInfo()
 
 def get_uptime_string(create_time: float) -> str:
     """Convert process create time to uptime string"""
-    try:
-        uptime_seconds = time.time() - create_time
-        hours = int(uptime_seconds // 3600)
-        minutes = int((uptime_seconds % 3600) // 60)
-        return f"{hours} hours {minutes} minutes"
-    except:
-        return "Unknown"
+    # Clamp at zero: a wall clock stepped backwards would otherwise yield
+    # negative hours
+    hours, remainder = divmod(max(0, int(time.time() - create_time)), 3600)
+    minutes, _ = divmod(remainder, 60)
+    return f"{hours} hours {minutes} minutes"
+
+def get_status_timestamp() -> str:
+    """Current local time in ISO format, cached at one-second resolution"""
+    global _last_timestamp
+    now = int(time.time())
+    if now != _last_timestamp[0]:
+        _last_timestamp = (now, datetime.fromtimestamp(now).isoformat())
+    return _last_timestamp[1]
 
 def get_system_services() -> List[ServiceStatus]:
     """Get status of system services"""
     services = []
     
     # FastAPI Backend (current process)
-    try:
-        current_process = psutil.Process()
-        proc_info = get_process_info(current_process.pid)
+    # get_process_info reuses cached process handles and already reports the
+    # create time, so no new psutil.Process is built per poll
+    backend_pid = os.getpid()
+    proc_info = get_process_info(backend_pid)
+    if proc_info.create_time is not None:
         services.append(ServiceStatus(
             name="FastAPI Backend",
             status="running",
             version="0.104.1",
             port=8000,
-            pid=current_process.pid,
-            uptime=get_uptime_string(current_process.create_time()),
-            memory_usage=proc_info.get('memory_usage', 0),
-            cpu_usage=proc_info.get('cpu_usage', 0)
+            pid=backend_pid,
+            uptime=get_uptime_string(proc_info.create_time),
+            memory_usage=proc_info.memory_usage,
+            cpu_usage=proc_info.cpu_usage
         ))
-    except:
+    else:
         services.append(ServiceStatus(
             name="FastAPI Backend",
             status="unknown",
@@ -129,22 +487,23 @@ def get_system_services() -> List[ServiceStatus]:
         ))
     
     # PostgreSQL
-    postgres_pid = get_process_by_port(5432)
-    if postgres_pid:
+    # Only resolve the PID (cached, or a connection table scan) when something
+    # is actually accepting connections on the port
+    postgres_pid = get_process_by_port(5432) if is_port_listening(5432) else None
+    if postgres_pid and psutil.pid_exists(postgres_pid):
         proc_info = get_process_info(postgres_pid)
-        try:
-            process = psutil.Process(postgres_pid)
+        if proc_info.create_time is not None:
             services.append(ServiceStatus(
                 name="PostgreSQL",
                 status="running",
                 version="17.0",
                 port=5432,
                 pid=postgres_pid,
-                uptime=get_uptime_string(process.create_time()),
-                memory_usage=proc_info.get('memory_usage', 0),
-                cpu_usage=proc_info.get('cpu_usage', 0)
+                uptime=get_uptime_string(proc_info.create_time),
+                memory_usage=proc_info.memory_usage,
+                cpu_usage=proc_info.cpu_usage
             ))
-        except:
+        else:
             services.append(ServiceStatus(
                 name="PostgreSQL",
                 status="running",
@@ -160,23 +519,55 @@ def get_system_services() -> List[ServiceStatus]:
         ))
     
     # pgvector Extension
-    try:
-        # This would require a database connection to check
-        services.append(ServiceStatus(
-            name="pgvector Extension",
-            status="running",
-            version="0.6.0"
-        ))
-    except:
-        services.append(ServiceStatus(
-            name="pgvector Extension",
-            status="unknown",
-            version="0.6.0"
-        ))
+    # This would require a database connection to check
+    services.append(ServiceStatus(
+        name="pgvector Extension",
+        status="running",
+        version="0.6.0"
+    ))
     
     return services
 
-def get_ai_models() -> List[ModelInfo]:
+async def probe_ready(url: str) -> bool:
+    """Return True if a health endpoint answers 200 within the timeout"""
+    try:
+        response = await http_client.get(url)
+    except httpx.HTTPError:
+        return False
+    return response.status_code == 200
+
+async def probe_nim_containers() -> Tuple[bool, bool]:
+    """Probe the NIM embeddings (8081) and generation (8083) containers in parallel"""
+    embeddings_ok, generation_ok = await asyncio.gather(
+        probe_ready("http://localhost:8081/v1/health/ready"),
+        probe_ready("http://localhost:8083/v1/health/ready"),
+    )
+    return embeddings_ok, generation_ok
+
+async def probe_nim_embeddings() -> Optional[ModelInfo]:
+    """Return the NIM embeddings model if its container reports ready"""
+    try:
+        response = await http_client.get("http://localhost:8081/v1/health/ready", timeout=2.0)
+    except httpx.HTTPError:
+        logger.info("NVIDIA NIM Embeddings not accessible")
+        return None
+    if response.status_code != 200:
+        return None
+    
+    logger.info("Detected NVIDIA NIM Embeddings model")
+    return ModelInfo(
+        name="nvidia/nv-embedqa-e5-v5",
+        type="nvidia-nim",
+        status="loaded",  # Embeddings are always loaded when container is running
+        size="1.2GB",
+        parameters="335M",
+        quantization="1024D vectors",
+        context_length=512,
+        memory_usage=1200,
+        last_used="Embeddings"  # Not a chat model, so never "Active"
+    )
+
+async def get_ai_models() -> List[ModelInfo]:
     """Get AI model information - ONLY REAL DETECTED MODELS"""
     models = []
     
@@ -191,159 +582,302 @@ def get_ai_models() -> List[ModelInfo]:
         service_states['active_model'] = active_model
         service_states['active_model_type'] = 'ollama'
     
-    # Detect real Ollama models
+    # Probe NIM readiness while the Ollama list is read (or fetched, before
+    # the background task has published one)
+    nim_probe = asyncio.ensure_future(probe_nim_embeddings())
+    
+    # Detect real Ollama models from the list kept fresh by the background task
+    ollama_models = service_states.get('ollama_models')
+    if ollama_models is None:
+        ollama_models = await refresh_ollama_models()
+    
+    for model in ollama_models:
+        # Check if this is the active model
+        status = "loaded" if model['name'] == active_model else "unloaded"
+        models.append(ModelInfo(
+            name=model['name'],
+            type="ollama",
+            status=status,
+            size=model['size'],
+            parameters=model['parameters'],
+            quantization=model['quantization'],
+            context_length=None,
+            memory_usage=None,
+            last_used="Active" if status == "loaded" else "Available"
+        ))
+    
+    # Check for real NVIDIA NIM models
+    nim_embeddings = await nim_probe
+    if nim_embeddings:
+        models.append(nim_embeddings)
+    
+    # Skip NIM Generation 8B - not in our optimized model set
+    # (Removed as redundant with Mistral Nemo for light tasks)
+    
+    # Skip NIM Generation 70B - requires 4x H100 GPUs minimum
+    # (Not compatible with single RTX 4090)
+    
+    # NIM is now the only embedding model - no sentence-transformers
+    
+    logger.info(f"Total real models detected: {len(models)}")
+    return models
+
+def parse_ollama_list(output: bytes) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (name, size) pairs from raw `ollama list` output.
+    Columns are NAME, ID, SIZE, MODIFIED; only NAME and SIZE are captured.
+    """
+    # Scan the buffer in place, starting after the header line
+    for match in OLLAMA_LIST_ROW_PATTERN.finditer(output, output.find(b"\n") + 1):
+        yield match.group(1).decode(), match.group(2).decode()
+
+async def fetch_ollama_models() -> List[Dict[str, str]]:
+    """List installed Ollama models via the HTTP API, falling back to the CLI"""
+    global _ollama_down_until
+    if time.monotonic() < _ollama_down_until:
+        return []
+    
+    models = []
     try:
         # First try to check if Ollama is accessible via HTTP
-        import requests
-        response = requests.get("http://localhost:11434/api/tags", timeout=3)
-        if response.status_code == 200:
-            ollama_data = response.json()
-            for model in ollama_data.get("models", []):
-                model_name = model.get("name", "unknown")
-                model_size = model.get("size", 0)
-                size_gb = f"{model_size / (1024**3):.1f}GB" if model_size > 0 else "Unknown"
-                
-                # Extract parameters from details
-                details = model.get("details", {})
-                parameters = details.get("parameter_size", "Unknown")
-                quantization = details.get("quantization_level", "Unknown")
-                
-                # Check if this is the active model
-                status = "loaded" if model_name == active_model else "unloaded"
-                models.append(ModelInfo(
-                    name=model_name,
-                    type="ollama", 
-                    status=status,
-                    size=size_gb,
-                    parameters=parameters,
-                    quantization=quantization,
-                    context_length=None,
-                    memory_usage=None,
-                    last_used="Active" if status == "loaded" else "Available"
-                ))
-                logger.info(f"Detected Ollama model: {model_name} ({size_gb})")
+        response = await http_client.get(f"{OLLAMA_BASE_URL}/api/tags")
+        response.raise_for_status()
+        for model in response.json().get("models", []):
+            model_size = model.get("size", 0)
+            # Extract parameters from details
+            details = model.get("details", {})
+            models.append({
+                'name': model.get("name", "unknown"),
+                'size': f"{model_size / (1024**3):.1f}GB" if model_size > 0 else "Unknown",
+                'parameters': details.get("parameter_size", "Unknown"),
+                'quantization': details.get("quantization_level", "Unknown")
+            })
+        return models
     except Exception as e:
         logger.info(f"Ollama HTTP check failed: {e}, trying command line...")
-        
-        # Fallback to command line check
-        try:
-            result = subprocess.run(['ollama', 'list'], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')[1:]  # Skip header
-                for line in lines:
-                    if line.strip():
-                        parts = line.split()
-                        if len(parts) >= 3:
-                            model_name = parts[0]
-                            model_size = parts[2] if len(parts) > 2 else "Unknown"
-                            # Check if this is the active model
-                            status = "loaded" if model_name == active_model else "unloaded"
-                            models.append(ModelInfo(
-                                name=model_name,
-                                type="ollama",
-                                status=status,
-                                size=model_size,
-                                parameters="Unknown",
-                                quantization="Unknown",
-                                context_length=None,
-                                memory_usage=None,
-                                last_used="Active" if status == "loaded" else "Available"
-                            ))
-                            logger.info(f"Detected Ollama model via CLI: {model_name} ({model_size})")
-        except Exception as e2:
-            logger.info(f"Ollama command line check also failed: {e2}")
     
-    # Check for real NVIDIA NIM models
+    # Fallback to command line check
     try:
-        # Check NIM Embeddings
-        try:
-            response = requests.get("http://localhost:8081/v1/health/ready", timeout=2)
-            if response.status_code == 200:
-                models.append(ModelInfo(
-                    name="nvidia/nv-embedqa-e5-v5",
-                    type="nvidia-nim",
-                    status="loaded",  # Embeddings are always loaded when container is running
-                    size="1.2GB",
-                    parameters="335M",
-                    quantization="1024D vectors",
-                    context_length=512,
-                    memory_usage=1200,
-                    last_used="Embeddings"  # Not a chat model, so never "Active"
-                ))
-                logger.info("Detected NVIDIA NIM Embeddings model")
-        except:
-            logger.info("NVIDIA NIM Embeddings not accessible")
-        
-        # Skip NIM Generation 8B - not in our optimized model set
-        # (Removed as redundant with Mistral Nemo for light tasks)
-        
-        # Skip NIM Generation 70B - requires 4x H100 GPUs minimum
-        # (Not compatible with single RTX 4090)
-            
+        result = await run_command_async(['ollama', 'list'])
+        if result.returncode == 0:
+            return [
+                {'name': name, 'size': size, 'parameters': "Unknown", 'quantization': "Unknown"}
+                for name, size in parse_ollama_list(result.stdout)
+            ]
+        logger.info(f"Ollama command line check exited with {result.returncode}")
     except Exception as e:
-        logger.info(f"NVIDIA NIM check failed: {e}")
+        logger.info(f"Ollama command line check also failed: {e}")
     
-    # NIM is now the only embedding model - no sentence-transformers
-    
-    logger.info(f"Total real models detected: {len(models)}")
+    logger.info(f"Ollama unreachable, skipping checks for {OLLAMA_DOWN_BACKOFF}s")
+    _ollama_down_until = time.monotonic() + OLLAMA_DOWN_BACKOFF
     return models
 
-def get_environment_info() -> EnvironmentInfo:
-    """Get environment and system information"""
-    # Get Python version
-    python_version = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+async def refresh_ollama_models() -> List[Dict[str, str]]:
+    """Fetch the Ollama model list and publish it to service_states"""
+    models = await fetch_ollama_models()
+    # Publish a new list rather than mutating the old one, so readers never
+    # observe a partially built list
+    service_states['ollama_models'] = models
+    logger.debug(f"Detected {len(models)} Ollama models")
+    return models
+
+async def pull_ollama_model(model_name: str):
+    """Pull a model through Ollama's streaming API, recording progress as it goes"""
+    state = service_states[f"pull:{model_name}"]
+    try:
+        # No read timeout: layers can take minutes between progress lines
+        async with http_client.stream(
+            "POST",
+            f"{OLLAMA_BASE_URL}/api/pull",
+            json={"name": model_name, "stream": True},
+            timeout=httpx.Timeout(10.0, read=None)
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                progress = json.loads(line)
+                if "error" in progress:
+                    raise RuntimeError(progress["error"])
+                state["status"] = progress.get("status", state["status"])
+                state["completed"] = progress.get("completed", state["completed"])
+                state["total"] = progress.get("total", state["total"])
+        
+        state["status"] = "success"
+        logger.info(f"Pulled Ollama model {model_name}")
+        await invalidate_model_cache()
+    except Exception as e:
+        logger.error(f"Failed to pull Ollama model {model_name}: {e}")
+        state["status"] = "error"
+        state["error"] = str(e)
+    finally:
+        state["done"] = True
+
+def start_ollama_pull(model_name: str, background_tasks: BackgroundTasks) -> str:
+    """
+    Schedule a model pull to run after the response is sent, unless a pull
+    for the model is already running. Progress lives in service_states["pull:<name>"].
+    """
+    state = service_states.get(f"pull:{model_name}")
+    if state is None or state["done"]:
+        service_states[f"pull:{model_name}"] = {
+            "status": "started",
+            "completed": 0,
+            "total": 0,
+            "done": False,
+            "error": None
+        }
+        background_tasks.add_task(pull_ollama_model, model_name)
+    return model_name
+
+async def refresh_ollama_models_loop():
+    """Keep the Ollama model list fresh so requests never block on Ollama"""
+    while True:
+        try:
+            await refresh_ollama_models()
+        except Exception as e:
+            logger.warning(f"Ollama model refresh failed: {e}")
+        # Model changes refresh the list directly via invalidate_model_cache
+        await asyncio.sleep(OLLAMA_REFRESH_INTERVAL)
+
+async def invalidate_model_cache():
+    """
+    Re-read the Ollama model list after a model change, then drop the cached
+    status. Refreshing first means the next status build, and every one
+    after it, reads the new list instead of re-caching the old one.
+    """
+    global _ollama_down_until, _latest_status
+    _ollama_down_until = 0.0
+    try:
+        await refresh_ollama_models()
+    except Exception as e:
+        logger.warning(f"Ollama model refresh failed: {e}")
+    _latest_status = None
+    _probe_cache.pop("models", None)
+
+async def send_to_all(connections: Set[WebSocket], payload: str):
+    """Send one pre-serialized message to every socket concurrently"""
+    sockets = list(connections)
+    results = await asyncio.gather(
+        *(websocket.send_text(payload) for websocket in sockets),
+        return_exceptions=True
+    )
+    # Drop sockets that failed to receive; their handlers clean up on disconnect
+    for websocket, result in zip(sockets, results):
+        if isinstance(result, Exception):
+            connections.discard(websocket)
+
+async def broadcast_model_status(status: Dict[str, Any]):
+    """Orchestrator status callback: serialize once and send to every socket"""
+    if active_connections:
+        await send_to_all(active_connections, orjson.dumps(status).decode())
+
+async def refresh_system_status() -> bytes:
+    """Rebuild and publish the serialized status snapshot"""
+    global _latest_status
+    _latest_status = orjson.dumps(await build_system_status())
+    return _latest_status
+
+async def get_latest_status() -> bytes:
+    """Latest status snapshot, built on demand until the refresher's first pass"""
+    return _latest_status or await refresh_system_status()
+
+async def refresh_system_status_loop():
+    """Refresh the status snapshot and push it to /ws/system-status subscribers"""
+    while True:
+        try:
+            payload = await refresh_system_status()
+            if status_connections:
+                await send_to_all(status_connections, payload.decode())
+        except Exception as e:
+            logger.warning(f"System status refresh failed: {e}")
+        await asyncio.sleep(STATUS_REFRESH_INTERVAL)
+
+async def start_background_tasks():
+    """Start system monitoring tasks; called from the application lifespan"""
+    if orchestrator is not None and broadcast_model_status not in orchestrator._status_update_callbacks:
+        orchestrator.register_status_callback(broadcast_model_status)
+    await asyncio.to_thread(prime_cpu_sampling)
+    # Probe node/nvcc versions up front so the first /status doesn't wait on them
+    _background_tasks.append(asyncio.create_task(get_static_environment()))
+    _background_tasks.append(asyncio.create_task(refresh_ollama_models_loop()))
+    _background_tasks.append(asyncio.create_task(refresh_system_status_loop()))
+
+async def stop_background_tasks():
+    """Cancel system monitoring tasks on application shutdown"""
+    if orchestrator is not None and broadcast_model_status in orchestrator._status_update_callbacks:
+        orchestrator._status_update_callbacks.remove(broadcast_model_status)
+    for task in _background_tasks:
+        task.cancel()
+    await asyncio.gather(*_background_tasks, return_exceptions=True)
+    _background_tasks.clear()
+    for pid in list(_proc_stat_fds):
+        close_proc_stat(pid)
+    await http_client.aclose()
+
+async def probe_static_environment() -> Mapping[str, Any]:
+    """Probe tool versions that cannot change while the backend is running"""
+    # Probe Node.js and CUDA versions concurrently
+    node_result, nvcc_result = await asyncio.gather(
+        run_command_async(['node', '--version']),
+        run_command_async(['nvcc', '--version']),
+        return_exceptions=True
+    )
     
     # Get Node.js version
     node_version = "Unknown"
-    try:
-        result = subprocess.run(['node', '--version'], capture_output=True, text=True, timeout=5)
-        if result.returncode == 0:
-            node_version = result.stdout.strip().replace('v', '')
-    except:
+    if isinstance(node_result, Exception):
         node_version = "18.17.0"  # Default
+    elif node_result.returncode == 0:
+        node_version = node_result.stdout.decode().strip().replace('v', '')
     
     # Get CUDA version
     cuda_version = None
-    try:
-        result = subprocess.run(['nvcc', '--version'], capture_output=True, text=True, timeout=5)
-        if result.returncode == 0:
-            for line in result.stdout.split('\n'):
-                if 'release' in line.lower():
-                    parts = line.split('release')
-                    if len(parts) > 1:
-                        cuda_version = parts[1].split(',')[0].strip()
-                        break
-    except:
+    if isinstance(nvcc_result, Exception):
         cuda_version = "12.2"  # Default
+    elif nvcc_result.returncode == 0:
+        match = CUDA_RELEASE_PATTERN.search(nvcc_result.stdout)
+        if match:
+            cuda_version = match.group(1).decode()
     
     # Get PyTorch version
     pytorch_version = None
     try:
-        import torch
-        pytorch_version = torch.__version__
-    except ImportError:
+        # Read the installed version from package metadata; importing torch
+        # itself would load the CUDA runtime just to report a string
+        pytorch_version = package_version("torch")
+    except PackageNotFoundError:
         pytorch_version = "2.1.0"  # Default
     
+    # Read-only view: the probe result is shared by every caller for the
+    # lifetime of the process
+    return MappingProxyType({
+        'python_version': PYTHON_VERSION,
+        'node_version': node_version,
+        'cuda_version': cuda_version,
+        'pytorch_version': pytorch_version,
+        'tensorflow_version': None,
+        'pgvector_version': "0.6.0",
+        'os_info': OS_INFO
+    })
+
+async def get_static_environment() -> Mapping[str, Any]:
+    """Static environment versions, probed once and kept for the process lifetime"""
+    return await get_cached("static_environment", probe_static_environment, ttl=float("inf"))
+
+async def get_environment_info() -> EnvironmentInfo:
+    """Get environment and system information"""
+    # Versions are probed once per process; only memory and GPU stats are live
+    static_env = await get_static_environment()
+    
     # Get system memory
     memory = psutil.virtual_memory()
     total_memory = round(memory.total / 1024 / 1024)  # MB
     available_memory = round(memory.available / 1024 / 1024)  # MB
     
-    # Get GPU info
-    gpu_info = None
-    try:
-        import GPUtil
-        gpus = GPUtil.getGPUs()
-        if gpus:
-            gpu = gpus[0]
-            gpu_info = {
-                'name': gpu.name,
-                'memory_total': round(gpu.memoryTotal),
-                'memory_used': round(gpu.memoryUsed),
-                'gpu_utilization': round(gpu.load * 100),
-                'temperature': gpu.temperature if hasattr(gpu, 'temperature') else None
-            }
-    except (ImportError, Exception):
+    # Get GPU info from the persistent NVML handle
+    gpu_info = gpu_monitor.get_gpu_stats()
+    if gpu_info is None:
         # Mock GPU info for RTX 4090
         gpu_info = {
             'name': 'NVIDIA RTX 4090',
@@ -354,67 +888,52 @@ def get_environment_info() -> EnvironmentInfo:
         }
     
     return EnvironmentInfo(
-        python_version=python_version,
-        node_version=node_version,
-        cuda_version=cuda_version,
-        pytorch_version=pytorch_version,
-        pgvector_version="0.6.0",
-        os_info=f"{platform.system()} {platform.release()}",
+        **static_env,
         total_memory=total_memory,
         available_memory=available_memory,
         gpu_info=gpu_info
     )
 
-@router.get("/status")
+# Status sections are cached already converted to plain JSON-ready data, so
+# polls within a section's TTL skip model validation and conversion entirely
+async def dump_services_section() -> List[Dict[str, Any]]:
+    return [service.model_dump() for service in await asyncio.to_thread(get_system_services)]
+
+async def dump_models_section() -> List[Dict[str, Any]]:
+    return [model.model_dump() for model in await get_ai_models()]
+
+async def dump_environment_section() -> Dict[str, Any]:
+    return (await get_environment_info()).model_dump()
+
+async def get_models_section() -> List[Dict[str, Any]]:
+    """Serialized model list, shared by /status and /models/available"""
+    return await get_cached("models", dump_models_section, MODELS_CACHE_DURATION)
+
+async def build_system_status() -> Dict[str, Any]:
+    """Collect the full system status payload (shaped like SystemStatus)"""
+    # Run the independent probes concurrently, each cached for its own
+    # lifetime; psutil work goes to a thread
+    services, models, environment = await asyncio.gather(
+        get_cached("services", dump_services_section, SERVICES_CACHE_DURATION),
+        get_models_section(),
+        get_cached("environment", dump_environment_section, ENVIRONMENT_CACHE_DURATION)
+    )
+    
+    return {
+        "services": services,
+        "models": models,
+        "environment": environment,
+        "last_updated": get_status_timestamp()
+    }
+
+@router.get("/status", response_model=SystemStatus, response_class=ORJSONResponse)
 async def get_system_status():
     """Get complete system status"""
     try:
-        services = get_system_services()
-        models = get_ai_models()
-        environment = get_environment_info()
-        
-        return {
-            "services": [
-                {
-                    "name": service.name,
-                    "status": service.status,
-                    "version": service.version,
-                    "port": service.port,
-                    "pid": service.pid,
-                    "uptime": service.uptime,
-                    "memory_usage": service.memory_usage,
-                    "cpu_usage": service.cpu_usage
-                }
-                for service in services
-            ],
-            "models": [
-                {
-                    "name": model.name,
-                    "type": model.type,
-                    "status": model.status,
-                    "size": model.size,
-                    "parameters": model.parameters,
-                    "quantization": model.quantization,
-                    "memory_usage": model.memory_usage,
-                    "context_length": model.context_length,
-                    "last_used": model.last_used
-                }
-                for model in models
-            ],
-            "environment": {
-                "python_version": environment.python_version,
-                "node_version": environment.node_version,
-                "cuda_version": environment.cuda_version,
-                "pytorch_version": environment.pytorch_version,
-                "tensorflow_version": environment.tensorflow_version,
-                "pgvector_version": environment.pgvector_version,
-                "os_info": environment.os_info,
-                "total_memory": environment.total_memory,
-                "available_memory": environment.available_memory,
-                "gpu_info": environment.gpu_info
-            },
-            "last_updated": datetime.now().isoformat()
-        }
+        # Serve the background snapshot (its last_updated shows its age);
+        # returning a Response skips re-validation against response_model,
+        # which remains for the API schema
+        return Response(content=await get_latest_status(), media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting system status: {str(e)}")
 
@@ -431,27 +950,15 @@ async def control_service(request: Dict[str, str]):
         raise HTTPException(status_code=400, detail="action must be start, stop, or restart")
     
     try:
-        if service_name == "PostgreSQL":
-            if action == "start":
-                if platform.system() == "Windows":
-                    subprocess.run(['net', 'start', 'postgresql-x64-17'], check=True)
-                else:
-                    subprocess.run(['sudo', 'systemctl', 'start', 'postgresql'], check=True)
-                message = "PostgreSQL service started successfully"
-            elif action == "stop":
-                if platform.system() == "Windows":
-                    subprocess.run(['net', 'stop', 'postgresql-x64-17'], check=True)
-                else:
-                    subprocess.run(['sudo', 'systemctl', 'stop', 'postgresql'], check=True)
-                message = "PostgreSQL service stopped successfully"
-            elif action == "restart":
-                if platform.system() == "Windows":
-                    subprocess.run(['net', 'stop', 'postgresql-x64-17'], check=False)
-                    time.sleep(2)
-                    subprocess.run(['net', 'start', 'postgresql-x64-17'], check=True)
-                else:
-                    subprocess.run(['sudo', 'systemctl', 'restart', 'postgresql'], check=True)
-                message = "PostgreSQL service restarted successfully"
+        steps = SERVICE_COMMANDS.get((service_name, action))
+        if steps:
+            for i, (cmd, check) in enumerate(steps):
+                if i:
+                    await asyncio.sleep(SERVICE_STEP_DELAY)
+                result = await run_command_async(cmd, timeout=SERVICE_CONTROL_TIMEOUT)
+                if check and result.returncode != 0:
+                    raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
+            message = f"{service_name} service {SERVICE_ACTION_PAST_TENSE[action]} successfully"
         
         elif service_name == "FastAPI Backend":
             if action == "restart":
@@ -469,10 +976,29 @@ async def control_service(request: Dict[str, str]):
         
     except subprocess.CalledProcessError as e:
         raise HTTPException(status_code=500, detail=f"Failed to {action} {service_name}: {str(e)}")
-    except Exception as e:
+    except (OSError, subprocess.SubprocessError) as e:
         raise HTTPException(status_code=500, detail=f"Error controlling service: {str(e)}")
 
-@router.get("/models/status")
+async def swap_nim_containers(stop_container: str, start_container: str):
+    """
+    Stop one NIM generation container, then start the other, without blocking
+    the event loop. Kept in order: both models cannot share the GPU's VRAM.
+    """
+    await run_command_async(['docker', 'stop', stop_container], timeout=SERVICE_CONTROL_TIMEOUT)
+    await run_command_async(['docker', 'start', start_container], timeout=SERVICE_CONTROL_TIMEOUT)
+
+def nim_container_for(model_name: str) -> str:
+    """Docker container serving the given NIM model"""
+    name = model_name.lower()
+    if "70b" in name:
+        return "nim-generation-70b"
+    if "8b" in name:
+        return "nim-generation-8b"
+    if "embed" in name:
+        return "nim-embeddings"
+    return "nim-generation-8b"  # Default
+
+@router.get("/models/status", response_class=ORJSONResponse)
 async def get_models_status():
     """Get comprehensive model status with real-time information"""
     try:
@@ -492,6 +1018,7 @@ async def switch_model(request: Dict[str, str]):
     try:
         success = await orchestrator.switch_to_model(model_name)
         if success:
+            await invalidate_model_cache()
             return {"success": True, "message": f"Switched to {model_name}"}
         else:
             raise HTTPException(status_code=500, detail="Failed to switch model")
@@ -536,33 +1063,39 @@ async def estimate_response_time(query: str, model_name: Optional[str] = None):
 async def websocket_model_status(websocket: WebSocket):
     """WebSocket endpoint for real-time model status updates"""
     await websocket.accept()
-    active_connections.append(websocket)
+    active_connections.add(websocket)
     
     # Send initial status
     try:
         status = await orchestrator.get_model_status()
-        await websocket.send_json(status)
+        await websocket.send_text(orjson.dumps(status).decode())
     except Exception as e:
         logger.error(f"Error sending initial status: {e}")
     
-    # Register callback for updates
-    async def send_update(status):
-        try:
-            await websocket.send_json(status)
-        except:
-            pass
-    
-    orchestrator.register_status_callback(send_update)
-    
+    # Updates arrive through broadcast_model_status; the receive loop only
+    # detects the disconnect. Always deregister, whatever ends the loop.
     try:
         while True:
-            # Keep connection alive
             await websocket.receive_text()
     except WebSocketDisconnect:
-        active_connections.remove(websocket)
-        # Remove callback when disconnected
-        if send_update in orchestrator._status_update_callbacks:
-            orchestrator._status_update_callbacks.remove(send_update)
+        pass
+    finally:
+        active_connections.discard(websocket)
+
+@router.websocket("/ws/system-status")
+async def websocket_system_status(websocket: WebSocket):
+    """WebSocket endpoint pushing the /status payload instead of HTTP polling"""
+    await websocket.accept()
+    status_connections.add(websocket)
+    try:
+        # Send initial status, then rely on refresh_system_status_loop
+        await websocket.send_text((await get_latest_status()).decode())
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        status_connections.discard(websocket)
 
 @router.post("/models/load")
 async def load_model(request: Dict[str, Any]):
@@ -577,23 +1110,19 @@ async def load_model(request: Dict[str, Any]):
         logger.error("ModelOrchestrator is not initialized - falling back to direct load")
         # Fallback to direct Ollama load
         try:
-            import subprocess
-            result = subprocess.run(
-                ['ollama', 'run', model_name, 'Hello'],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            result = await run_command_async(['ollama', 'run', model_name, 'Hello'], timeout=30)
             if result.returncode == 0:
+                await invalidate_model_cache()
                 return {"success": True, "message": f"Model {model_name} loaded successfully (direct)"}
             else:
-                raise HTTPException(status_code=500, detail=f"Failed to load model: {result.stderr}")
+                raise HTTPException(status_code=500, detail=f"Failed to load model: {result.stderr.decode(errors='replace')}")
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error loading model: {str(e)}")
     
     try:
         success = await orchestrator.load_model(model_name)
         if success:
+            await invalidate_model_cache()
             return {"success": True, "message": f"Model {model_name} loaded successfully"}
         else:
             model = orchestrator.get_model_info(model_name)
@@ -609,41 +1138,58 @@ async def load_model(request: Dict[str, Any]):
 async def unload_model(request: Dict[str, str]):
     """Unload a specific model"""
     model_name = request.get("model_name")
+    model_type = request.get("model_type", "ollama")
     
     if not model_name:
         raise HTTPException(status_code=400, detail="model_name is required")
     
-    # Check if orchestrator is available
-    if orchestrator is None:
-        logger.error("ModelOrchestrator is not initialized - falling back to direct unload")
-        # Fallback to direct Ollama stop
+    if orchestrator is not None:
         try:
-            import subprocess
-            result = subprocess.run(
-                ['ollama', 'stop', model_name],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            return {"success": True, "message": f"Model {model_name} unloaded successfully (direct)"}
+            success = await orchestrator.unload_model(model_name)
+            if success:
+                await invalidate_model_cache()
+                return {"success": True, "message": f"Model {model_name} unloaded successfully"}
+            else:
+                raise HTTPException(status_code=500, detail="Failed to unload model")
         except Exception as e:
-            return {"success": True, "message": f"Model {model_name} marked as unloaded"}
+            logger.error(f"Error unloading model: {e}")
+            import traceback
+            logger.error(traceback.format_exc())
+            raise HTTPException(status_code=500, detail=str(e))
     
+    # Orchestrator unavailable - stop the model directly
+    logger.error("ModelOrchestrator is not initialized - falling back to direct unload")
     try:
-        success = await orchestrator.unload_model(model_name)
-        if success:
-            return {"success": True, "message": f"Model {model_name} unloaded successfully"}
+        if model_type == "nvidia-nim":
+            # Stop the appropriate NIM container
+            result = await run_command_async(['docker', 'stop', nim_container_for(model_name)], timeout=30)
+            if result.returncode == 0:
+                message = f"NVIDIA NIM model {model_name} container stopped successfully"
+            else:
+                message = f"NVIDIA NIM model {model_name} container stop initiated"
+        
+        elif model_type == "ollama":
+            # Actually stop the Ollama model to free memory
+            result = await run_command_async(['ollama', 'stop', model_name], timeout=10)
+            if result.returncode == 0:
+                message = f"Ollama model {model_name} stopped and unloaded from memory"
+            else:
+                message = f"Ollama model {model_name} marked as inactive"
+        
         else:
-            raise HTTPException(status_code=500, detail="Failed to unload model")
-    except Exception as e:
-        logger.error(f"Error unloading model: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
-        raise HTTPException(status_code=500, detail=str(e))
+            message = f"Model {model_name} unloaded from memory"
+    except (OSError, subprocess.SubprocessError):
+        message = f"Model {model_name} marked as unloaded"
+    
+    await invalidate_model_cache()
+    return {
+        "success": True,
+        "message": message
+    }
 
 # Keep the original load_model implementation for backward compatibility
 @router.post("/models/load-legacy")
-async def load_model_legacy(request: Dict[str, Any]):
+async def load_model_legacy(request: Dict[str, Any], background_tasks: BackgroundTasks):
     """Legacy model loading endpoint"""
     model_name = request.get("model_name")
     model_type = request.get("model_type", "ollama")
@@ -652,48 +1198,26 @@ async def load_model_legacy(request: Dict[str, Any]):
     if not model_name:
         raise HTTPException(status_code=400, detail="model_name is required")
     
+    task_id = None
     try:
         if model_type == "ollama":
-            # Use the Ollama service to pull the model
+            # Check if model already exists
             try:
                 from ...services.ollama_service import get_ollama_service
-                ollama_service = get_ollama_service()
-                
-                # Check if model already exists
-                model_exists = await ollama_service.check_model_exists(model_name)
-                
-                if model_exists:
-                    message = f"Ollama model {model_name} is already available"
-                else:
-                    # Pull the model asynchronously
-                    success = await ollama_service.pull_model(model_name)
-                    if success:
-                        message = f"Ollama model {model_name} loaded successfully"
-                    else:
-                        message = f"Loading Ollama model {model_name}... This may take several minutes."
+                model_exists = await get_ollama_service().check_model_exists(model_name)
             except ImportError:
-                # Fallback to subprocess if service not available
-                result = subprocess.run(['ollama', 'pull', model_name], 
-                                     capture_output=True, text=True, timeout=300)
-                if result.returncode == 0:
-                    message = f"Ollama model {model_name} loaded successfully"
-                else:
-                    message = f"Loading Ollama model {model_name}... This may take a few minutes."
+                model_exists = False
+            
+            if model_exists:
+                message = f"Ollama model {model_name} is already available"
+            else:
+                # Pull in the background; progress via /models/pull/status/{model_name}
+                task_id = start_ollama_pull(model_name, background_tasks)
+                message = f"Loading Ollama model {model_name}... This may take several minutes."
         
         elif model_type == "nvidia-nim":
             # Start the appropriate NIM container
-            if "70b" in model_name.lower():
-                container_name = "nim-generation-70b"
-            elif "8b" in model_name.lower():
-                container_name = "nim-generation-8b"
-            elif "embed" in model_name.lower():
-                container_name = "nim-embeddings"
-            else:
-                container_name = "nim-generation-8b"  # Default
-            
-            # Start the container
-            result = subprocess.run(['docker', 'start', container_name], 
-                                 capture_output=True, text=True, timeout=60)
+            result = await run_command_async(['docker', 'start', nim_container_for(model_name)], timeout=60)
             if result.returncode == 0:
                 message = f"NVIDIA NIM model {model_name} container started successfully"
             else:
@@ -706,10 +1230,14 @@ async def load_model_legacy(request: Dict[str, Any]):
         else:
             message = f"Model type {model_type} not supported"
         
-        return {
+        await invalidate_model_cache()
+        response = {
             "success": True,
             "message": message
         }
+        if task_id:
+            response["task_id"] = task_id
+        return response
         
     except subprocess.TimeoutExpired:
         return {
@@ -719,57 +1247,13 @@ async def load_model_legacy(request: Dict[str, Any]):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error loading model: {str(e)}")
 
-@router.post("/models/unload")
-async def unload_model(request: Dict[str, str]):
-    """Unload an AI model"""
-    model_name = request.get("model_name")
-    model_type = request.get("model_type", "ollama")
-    
-    if not model_name:
-        raise HTTPException(status_code=400, detail="model_name is required")
-    
-    try:
-        if model_type == "nvidia-nim":
-            # Stop the appropriate NIM container
-            if "70b" in model_name.lower():
-                container_name = "nim-generation-70b"
-            elif "8b" in model_name.lower():
-                container_name = "nim-generation-8b"
-            elif "embed" in model_name.lower():
-                container_name = "nim-embeddings"
-            else:
-                container_name = "nim-generation-8b"  # Default
-            
-            # Stop the container
-            result = subprocess.run(['docker', 'stop', container_name], 
-                                 capture_output=True, text=True, timeout=30)
-            if result.returncode == 0:
-                message = f"NVIDIA NIM model {model_name} container stopped successfully"
-            else:
-                message = f"NVIDIA NIM model {model_name} container stop initiated"
-        
-        elif model_type == "ollama":
-            # Actually stop the Ollama model to free memory
-            try:
-                result = subprocess.run(['ollama', 'stop', model_name], 
-                                     capture_output=True, text=True, timeout=10)
-                if result.returncode == 0:
-                    message = f"Ollama model {model_name} stopped and unloaded from memory"
-                else:
-                    message = f"Ollama model {model_name} marked as inactive"
-            except:
-                message = f"Ollama model {model_name} marked as inactive"
-        
-        else:
-            message = f"Model {model_name} unloaded from memory"
-        
-        return {
-            "success": True,
-            "message": message
-        }
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error unloading model: {str(e)}")
+@router.get("/models/pull/status/{model_name:path}")
+async def get_pull_status(model_name: str):
+    """Get progress of a background Ollama model pull"""
+    state = service_states.get(f"pull:{model_name}")
+    if state is None:
+        raise HTTPException(status_code=404, detail=f"No pull started for {model_name}")
+    return state
 
 @router.post("/models/switch")
 async def switch_model(request: Dict[str, str]):
@@ -789,19 +1273,18 @@ async def switch_model(request: Dict[str, str]):
         if model_type == "nvidia-nim":
             if "70b" in model_name.lower():
                 # Switch to 70B - stop 8B, start 70B
-                subprocess.run(['docker', 'stop', 'nim-generation-8b'], capture_output=True)
-                subprocess.run(['docker', 'start', 'nim-generation-70b'], capture_output=True)
+                await swap_nim_containers('nim-generation-8b', 'nim-generation-70b')
                 message = f"Switched to high-quality model {model_name} (70B)"
             elif "8b" in model_name.lower():
-                # Switch to 8B - stop 70B, start 8B  
-                subprocess.run(['docker', 'stop', 'nim-generation-70b'], capture_output=True)
-                subprocess.run(['docker', 'start', 'nim-generation-8b'], capture_output=True)
+                # Switch to 8B - stop 70B, start 8B
+                await swap_nim_containers('nim-generation-70b', 'nim-generation-8b')
                 message = f"Switched to fast model {model_name} (8B)"
             else:
                 message = f"Switched to model {model_name}"
         else:
             message = f"Switched to {model_type} model {model_name}"
         
+        await invalidate_model_cache()
         return {
             "success": True,
             "message": message
@@ -810,12 +1293,10 @@ async def switch_model(request: Dict[str, str]):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error switching model: {str(e)}")
 
-@router.get("/ollama/health")
-async def check_ollama_health():
-    """Check Ollama service health and available models"""
+async def probe_ollama_health() -> Dict[str, Any]:
+    """Query Ollama's model list and describe its health"""
     try:
-        import requests
-        response = requests.get("http://10.1.0.224:11434/api/tags", timeout=5)
+        response = await http_client.get("http://10.1.0.224:11434/api/tags", timeout=5.0)
         
         if response.status_code == 200:
             data = response.json()
@@ -831,80 +1312,48 @@ async def check_ollama_health():
                 "status": "error",
                 "message": f"Ollama responded with status {response.status_code}"
             }
-    except Exception as e:
+    except (httpx.HTTPError, ValueError) as e:
         return {
             "accessible": False,
             "status": "error", 
             "message": f"Cannot reach Ollama: {str(e)}"
         }
 
-@router.get("/models/available")
+@router.get("/ollama/health")
+async def check_ollama_health():
+    """Check Ollama service health and available models"""
+    # Cached (failures included) so a chatty UI, or an unreachable host with
+    # its 5s timeout, costs at most one probe per window
+    return await get_cached("ollama_health", probe_ollama_health, ttl=OLLAMA_HEALTH_CACHE_DURATION)
+
+@router.get("/models/available", response_model=List[ModelInfo], response_class=ORJSONResponse)
 async def get_available_models():
     """Get list of all available AI models (Ollama + NIM)"""
     # Return all detected models from get_ai_models()
-    return get_ai_models()
+    return ORJSONResponse(await get_models_section())
+
+def nim_model_entry(model: NimModel, healthy: bool, loaded_memory: float) -> NimModel:
+    """Return the static NIM entry, switched to its loaded state if healthy"""
+    if not healthy:
+        return model
+    return model.model_copy(update={
+        "status": "loaded",
+        "memory_usage": loaded_memory,
+        "last_used": "Active"
+    })
 
-@router.get("/models/available-nim-only")
+@router.get("/models/available-nim-only", response_model=List[NimModel], response_model_exclude_none=True)
 async def get_available_nim_models():
     """Get list of available NVIDIA NIM models only"""
     try:
-        # Check NIM container status
-        nim_status = {
-            "embeddings": {"healthy": False},
-            "generation": {"healthy": False}
-        }
-        
-        # Check NIM Embeddings health
-        try:
-            async with httpx.AsyncClient(timeout=3.0) as client:
-                response = await client.get("http://localhost:8081/v1/health/ready")
-                nim_status["embeddings"]["healthy"] = response.status_code == 200
-        except:
-            pass
-        
-        # Check NIM Generation 70B health
-        try:
-            async with httpx.AsyncClient(timeout=3.0) as client:
-                response = await client.get("http://localhost:8083/v1/health/ready")
-                nim_status["generation"]["healthy"] = response.status_code == 200
-        except:
-            pass
+        # Check NIM Embeddings and Generation 70B health concurrently
+        embeddings_ok, generation_ok = await probe_nim_containers()
         
         # Return actual NIM models with real status
         models = [
-            {
-                "name": "meta/llama-3.1-70b-instruct",
-                "type": "NVIDIA NIM",
-                "status": "loaded" if nim_status["generation"]["healthy"] else "unloaded",
-                "size": "22GB",
-                "parameters": "70B",
-                "quantization": "TensorRT Optimized",
-                "memory_usage": 22000 if nim_status["generation"]["healthy"] else 0,
-                "context_length": 131072,
-                "last_used": "Active" if nim_status["generation"]["healthy"] else "Inactive",
-                "container": "nim-generation-70b",
-                "port": 8083
-            },
-            {
-                "name": "nvidia/nv-embedqa-e5-v5",
-                "type": "NVIDIA NIM Embeddings", 
-                "status": "loaded" if nim_status["embeddings"]["healthy"] else "unloaded",
-                "size": "15GB",
-                "parameters": "7.9B",
-                "memory_usage": 3200 if nim_status["embeddings"]["healthy"] else 0,
-                "context_length": 32768,
-                "last_used": "Active" if nim_status["embeddings"]["healthy"] else "Inactive",
-                "container": "nim-embeddings",
-                "port": 8081
-                },
-            {
-                "name": "NeMo Document AI",
-                "type": "Document Processing",
-                "status": "unloaded",
-                "size": "2.1GB",
-                "parameters": "Hierarchical Processing",
-                "note": "Available for document structure preservation"
-            }
+            nim_model_entry(NIM_GENERATION_MODEL, generation_ok, NIM_GENERATION_MEMORY),
+            nim_model_entry(NIM_EMBEDDINGS_MODEL, embeddings_ok, NIM_EMBEDDINGS_MEMORY),
+            NEMO_DOCUMENT_MODEL
         ]
         
         return models
@@ -912,33 +1361,25 @@ async def get_available_nim_models():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting available models: {str(e)}")
 
-@router.get("/nim/status")
+@router.get("/nim/status", response_model=Dict[str, NimStatusEntry])
 async def get_nim_status():
     """Get real-time status of NVIDIA NIM containers"""
     try:
+        # Check NIM Embeddings and Generation 70B health concurrently
+        embeddings_ok, generation_ok = await probe_nim_containers()
         nim_status = {
-            "embeddings": {"healthy": False, "model": "nvidia/nv-embedqa-e5-v5"},
-            "generation": {"healthy": False, "model": "meta/llama-3.1-70b-instruct"}
+            "embeddings": NimStatusEntry(
+                healthy=embeddings_ok,
+                model="nvidia/nv-embedqa-e5-v5",
+                status="loaded" if embeddings_ok else "unloaded"
+            ),
+            "generation": NimStatusEntry(
+                healthy=generation_ok,
+                model="meta/llama-3.1-70b-instruct",
+                status="loaded" if generation_ok else "unloaded"
+            )
         }
         
-        # Check NIM Embeddings health
-        try:
-            async with httpx.AsyncClient(timeout=3.0) as client:
-                response = await client.get("http://localhost:8081/v1/health/ready")
-                nim_status["embeddings"]["healthy"] = response.status_code == 200
-                nim_status["embeddings"]["status"] = "loaded"
-        except:
-            nim_status["embeddings"]["status"] = "unloaded"
-        
-        # Check NIM Generation 70B health
-        try:
-            async with httpx.AsyncClient(timeout=3.0) as client:
-                response = await client.get("http://localhost:8083/v1/health/ready")
-                nim_status["generation"]["healthy"] = response.status_code == 200
-                nim_status["generation"]["status"] = "loaded"
-        except:
-            nim_status["generation"]["status"] = "unloaded"
-        
         return nim_status
         
     except Exception as e:
@@ -1,9 +1,10 @@
 """Fast system status endpoints for UI responsiveness"""
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from fastapi import APIRouter
+from ...core import gpu_monitor
+import asyncio
 import logging
 from datetime import datetime, timedelta
-import threading
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -11,71 +12,109 @@ router = APIRouter()
 # Cache for expensive operations
 _model_status_cache = {
     "data": None,
-    "timestamp": None,
-    "lock": threading.Lock()
+    "timestamp": None
+}
+
+# Refresh currently running for _model_status_cache; concurrent pollers on
+# a cache miss await it instead of each querying the orchestrator
+_model_status_inflight: Optional[asyncio.Task] = None
+
+_vram_cache = {
+    "data": None,
+    "timestamp": None
 }
 
 CACHE_DURATION = timedelta(seconds=5)  # Cache for 5 seconds
 
+def get_fresh_cached(cache: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return the cached payload if it is younger than CACHE_DURATION"""
+    data, timestamp = cache["data"], cache["timestamp"]
+    if data is not None and timestamp is not None and datetime.now() - timestamp < CACHE_DURATION:
+        return data
+    return None
+
+async def refresh_active_model() -> Dict[str, Any]:
+    """Read the active model from the orchestrator and update the cache"""
+    try:
+        from ...services.model_orchestrator import orchestrator
+        active_model = orchestrator.active_primary_model
+        
+        result = {
+            "active_model": active_model if active_model else "qwen2.5:32b-instruct-q4_K_M",
+            "timestamp": datetime.now().isoformat()
+        }
+        
+        # Update cache
+        _model_status_cache["data"] = result
+        _model_status_cache["timestamp"] = datetime.now()
+        
+        return result
+        
+    except Exception as e:
+        logger.error(f"Error getting active model: {e}")
+        # Return default
+        return {
+            "active_model": "qwen2.5:32b-instruct-q4_K_M",
+            "timestamp": datetime.now().isoformat(),
+            "error": str(e)
+        }
+
+def _clear_model_status_inflight(task: asyncio.Task):
+    global _model_status_inflight
+    if _model_status_inflight is task:
+        _model_status_inflight = None
+
 @router.get("/active-model-quick")
 async def get_active_model_quick() -> Dict[str, Any]:
     """
     Quick endpoint to get just the active model name.
     Uses caching to avoid slow GPU queries.
     """
-    with _model_status_cache["lock"]:
-        # Check cache
-        if (_model_status_cache["data"] is not None and 
-            _model_status_cache["timestamp"] is not None and
-            datetime.now() - _model_status_cache["timestamp"] < CACHE_DURATION):
-            return _model_status_cache["data"]
-        
-        # Cache miss - get fresh data
-        try:
-            from ...services.model_orchestrator import orchestrator
-            active_model = orchestrator.get_active_model()
-            
-            result = {
-                "active_model": active_model if active_model else "qwen2.5:32b-instruct-q4_K_M",
-                "timestamp": datetime.now().isoformat()
-            }
-            
-            # Update cache
-            _model_status_cache["data"] = result
-            _model_status_cache["timestamp"] = datetime.now()
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"Error getting active model: {e}")
-            # Return default
-            return {
-                "active_model": "qwen2.5:32b-instruct-q4_K_M",
-                "timestamp": datetime.now().isoformat(),
-                "error": str(e)
-            }
+    global _model_status_inflight
+    
+    # Cache hit needs no coordination
+    cached = get_fresh_cached(_model_status_cache)
+    if cached is not None:
+        return cached
+    
+    # Cache miss - the first caller starts the refresh, the rest share it.
+    # No await separates the check from the assignment, so this is atomic
+    # on the event loop.
+    if _model_status_inflight is None:
+        _model_status_inflight = asyncio.create_task(refresh_active_model())
+        _model_status_inflight.add_done_callback(_clear_model_status_inflight)
+    
+    # Shielded so a disconnecting poller does not cancel the shared refresh
+    return await asyncio.shield(_model_status_inflight)
 
 @router.get("/vram-usage-quick")
 async def get_vram_usage_quick() -> Dict[str, Any]:
     """
     Quick VRAM usage check with caching.
     """
-    try:
-        import pynvml
-        pynvml.nvmlInit()
-        handle = pynvml.nvmlDeviceGetHandleByIndex(0)
-        info = pynvml.nvmlDeviceGetMemoryInfo(handle)
-        
-        return {
-            "used_gb": round(info.used / (1024**3), 1),
-            "total_gb": round(info.total / (1024**3), 1),
-            "free_gb": round(info.free / (1024**3), 1),
-            "timestamp": datetime.now().isoformat()
-        }
-    except:
+    cached = get_fresh_cached(_vram_cache)
+    if cached is not None:
+        return cached
+    
+    # NVML is initialised once by gpu_monitor; this is a single memory query
+    info = gpu_monitor.get_gpu_memory()
+    if info is None:
         return {
             "used_gb": 0,
             "total_gb": 24,
             "free_gb": 24,
             "timestamp": datetime.now().isoformat()
-        }
\ No newline at end of file
+        }
+    
+    result = {
+        "used_gb": round(info.used / (1024**3), 1),
+        "total_gb": round(info.total / (1024**3), 1),
+        "free_gb": round(info.free / (1024**3), 1),
+        "timestamp": datetime.now().isoformat()
+    }
+    
+    # Update cache
+    _vram_cache["data"] = result
+    _vram_cache["timestamp"] = datetime.now()
+    
+    return result
\ No newline at end of file
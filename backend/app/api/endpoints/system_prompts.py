@@ -1,10 +1,11 @@
 """
 API endpoints for System Prompts management
 """
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
 
 from app.db.database import get_db
 from app.db.repositories.system_prompt_repository import SystemPromptRepository
@@ -17,6 +18,18 @@ from app.schemas.system_prompt import (
 
 router = APIRouter(tags=["system-prompts"])
 
+# Active prompt as last read from the database. It only changes through the
+# write endpoints below, each of which refreshes or clears it. "No active
+# prompt" is not cached, so the chat endpoint activating the default when
+# none is set cannot leave it stale.
+_active_prompt_cache: Optional[SystemPromptResponse] = None
+
+
+def set_active_prompt_cache(prompt: Optional[SystemPromptResponse]) -> None:
+    """Replace (or clear, with None) the cached active system prompt"""
+    global _active_prompt_cache
+    _active_prompt_cache = prompt
+
 
 @router.get("/", response_model=List[SystemPromptResponse])
 async def get_all_system_prompts(
@@ -37,6 +50,9 @@ async def get_all_system_prompts(
 @router.get("/active", response_model=SystemPromptResponse)
 async def get_active_system_prompt(db: Session = Depends(get_db)):
     """Get the currently active system prompt"""
+    if _active_prompt_cache is not None:
+        return _active_prompt_cache
+    
     repo = SystemPromptRepository()
     active_prompt = repo.get_active(db)
     
@@ -46,7 +62,8 @@ async def get_active_system_prompt(db: Session = Depends(get_db)):
             detail="No active system prompt found"
         )
     
-    return active_prompt
+    set_active_prompt_cache(SystemPromptResponse.model_validate(active_prompt))
+    return _active_prompt_cache
 
 
 @router.get("/{prompt_id}", response_model=SystemPromptResponse)
@@ -75,18 +92,14 @@ async def create_system_prompt(
     """Create a new system prompt"""
     repo = SystemPromptRepository()
     
-    # Check if name already exists
-    existing = db.query(repo.model).filter(
-        repo.model.name == prompt_data.name
-    ).first()
-    
-    if existing:
+    # system_prompts.name is UNIQUE; let the insert itself detect duplicates
+    try:
+        prompt = repo.create(db, obj_in=prompt_data)
+    except IntegrityError:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"System prompt with name '{prompt_data.name}' already exists"
         )
-    
-    prompt = repo.create(db, obj_in=prompt_data)
     return prompt
 
 
@@ -98,34 +111,33 @@ async def update_system_prompt(
 ):
     """Update a system prompt"""
     repo = SystemPromptRepository()
-    prompt = repo.get(db, prompt_id)
     
-    if not prompt:
+    # One conditional UPDATE; default prompts are excluded in SQL. A rename
+    # onto an existing name violates the UNIQUE constraint on name
+    try:
+        updated_prompt = repo.update_if_mutable(db, prompt_id, prompt_data.model_dump(exclude_unset=True))
+    except IntegrityError:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"System prompt with id {prompt_id} not found"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"System prompt with name '{prompt_data.name}' already exists"
         )
     
-    # Don't allow updating default prompts
-    if prompt.is_default:
+    if updated_prompt is None:
+        # Nothing matched - tell a missing prompt from a default one
+        if repo.get_flags(db, prompt_id) is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"System prompt with id {prompt_id} not found"
+            )
+        # Don't allow updating default prompts
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot modify default system prompts"
         )
     
-    # Check if new name already exists (if name is being changed)
-    if prompt_data.name and prompt_data.name != prompt.name:
-        existing = db.query(repo.model).filter(
-            repo.model.name == prompt_data.name
-        ).first()
-        
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"System prompt with name '{prompt_data.name}' already exists"
-            )
-    
-    updated_prompt = repo.update(db, db_obj=prompt, obj_in=prompt_data.model_dump(exclude_unset=True))
+    # The active prompt's content may just have changed
+    if updated_prompt.is_active:
+        set_active_prompt_cache(None)
     return updated_prompt
 
 
@@ -136,30 +148,31 @@ async def delete_system_prompt(
 ):
     """Delete a system prompt"""
     repo = SystemPromptRepository()
-    prompt = repo.get(db, prompt_id)
     
-    if not prompt:
+    # One conditional DELETE; default and active prompts are excluded in SQL
+    if repo.remove_if_mutable(db, prompt_id):
+        return None
+    
+    # Nothing deleted - find out why
+    flags = repo.get_flags(db, prompt_id)
+    if flags is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"System prompt with id {prompt_id} not found"
         )
     
     # Don't allow deleting default prompts
-    if prompt.is_default:
+    if flags.is_default:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot delete default system prompts"
         )
     
     # Don't allow deleting the active prompt
-    if prompt.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Cannot delete the active system prompt. Please activate another prompt first."
-        )
-    
-    repo.remove(db, id=prompt_id)
-    return None
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Cannot delete the active system prompt. Please activate another prompt first."
+    )
 
 
 @router.post("/activate/{prompt_id}", response_model=SystemPromptResponse)
@@ -172,6 +185,7 @@ async def activate_system_prompt(
     
     try:
         activated_prompt = repo.set_active(db, prompt_id)
+        set_active_prompt_cache(SystemPromptResponse.model_validate(activated_prompt))
         return activated_prompt
     except ValueError as e:
         raise HTTPException(
@@ -185,6 +199,7 @@ async def deactivate_all_system_prompts(db: Session = Depends(get_db)):
     """Deactivate all system prompts"""
     repo = SystemPromptRepository()
     repo.deactivate_all(db)
+    set_active_prompt_cache(None)
     return None
 
 
@@ -193,6 +208,8 @@ async def seed_default_prompts(db: Session = Depends(get_db)):
     """Create default system prompts if they don't exist"""
     repo = SystemPromptRepository()
     created_prompts = repo.create_default_prompts(db)
+    # Seeding can create an active default prompt
+    set_active_prompt_cache(None)
     
     # If no prompts were created, return all existing prompts
     if not created_prompts:
@@ -3,29 +3,92 @@ System Resources Monitoring API Endpoints
 """
 
 from fastapi import APIRouter, HTTPException
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 import psutil
 import platform
-import GPUtil
+import json
 import shutil
 import subprocess
 import os
+import time
+import asyncio
+import threading
+from ...core import gpu_monitor
 
 router = APIRouter()
 
-def get_cpu_info_windows():
-    """Get CPU info on Windows using wmic"""
+# The UI polls /resources; answers are reused for this many seconds
+RESOURCES_CACHE_DURATION = 2.0
+
+_resources_cache = {
+    "data": None,
+    "timestamp": 0.0
+}
+
+# cpu_percent(interval=None) reports usage since the previous call. Prime it
+# once so the first poll has a baseline; after that the gap between polls
+# (at least RESOURCES_CACHE_DURATION) is the sampling window.
+psutil.cpu_percent(interval=None)
+
+# One PowerShell/CIM query for all static hardware details, replacing three
+# separate (and deprecated) wmic invocations
+HW_INFO_COMMAND = (
+    "ConvertTo-Json -Compress @{"
+    "cpu=@(Get-CimInstance Win32_Processor | Select-Object Name);"
+    "mem=@(Get-CimInstance Win32_PhysicalMemory | Select-Object Speed);"
+    "disk=@(Get-CimInstance Win32_DiskDrive | Select-Object Model,InterfaceType,MediaType)"
+    "}"
+)
+
+# Static hardware details never change, so a successful probe is kept for the
+# life of the process. A failed probe is not cached; it is retried once
+# HW_INFO_RETRY_SECONDS have passed so a flaky PowerShell isn't rerun every poll.
+HW_INFO_RETRY_SECONDS = 60.0
+
+_static_hw_info: Dict[str, List[Dict[str, Any]]] = {}
+_static_hw_info_failed_at: Optional[float] = None
+_static_hw_info_lock = threading.Lock()
+
+def probe_static_hw_info_windows() -> Dict[str, List[Dict[str, Any]]]:
+    """Run the CIM query, returning {} if PowerShell fails or times out"""
     try:
-        # Get CPU name
         result = subprocess.run(
-            ['wmic', 'cpu', 'get', 'name', '/value'],
-            capture_output=True, text=True, shell=True
+            ['powershell', '-NoProfile', '-NonInteractive', '-Command', HW_INFO_COMMAND],
+            capture_output=True, text=True, timeout=15
         )
-        cpu_model = ""
-        for line in result.stdout.strip().split('\n'):
-            if line.startswith('Name='):
-                cpu_model = line.split('=', 1)[1].strip()
-                break
+        data = json.loads(result.stdout)
+    except (OSError, subprocess.SubprocessError, ValueError):
+        return {}
+    
+    # A single instance may still serialize as a bare object
+    return {
+        key: value if isinstance(value, list) else [value]
+        for key, value in data.items() if value
+    }
+
+def get_static_hw_info_windows() -> Dict[str, List[Dict[str, Any]]]:
+    """Get CPU, memory chip and disk drive details on Windows in one CIM call"""
+    global _static_hw_info, _static_hw_info_failed_at
+    # The per-detail helpers run concurrently; the lock keeps it to one probe
+    with _static_hw_info_lock:
+        if _static_hw_info:
+            return _static_hw_info
+        if (_static_hw_info_failed_at is not None
+                and time.monotonic() - _static_hw_info_failed_at < HW_INFO_RETRY_SECONDS):
+            return {}
+        
+        info = probe_static_hw_info_windows()
+        if info:
+            _static_hw_info = info
+        else:
+            _static_hw_info_failed_at = time.monotonic()
+        return info
+
+def get_cpu_info_windows():
+    """Get CPU info on Windows"""
+    try:
+        cpus = get_static_hw_info_windows().get("cpu", [])
+        cpu_model = (cpus[0].get("Name") or "").strip() if cpus else ""
         
         # Determine brand from model name
         brand = "Unknown"
@@ -43,18 +106,12 @@ def get_cpu_info_windows():
         return "Unknown", "Unknown CPU"
 
 def get_ram_speed_windows():
-    """Get RAM speed on Windows using wmic"""
+    """Get RAM speed on Windows"""
     try:
-        result = subprocess.run(
-            ['wmic', 'memorychip', 'get', 'speed', '/value'],
-            capture_output=True, text=True, shell=True
-        )
-        speeds = []
-        for line in result.stdout.strip().split('\n'):
-            if line.startswith('Speed='):
-                speed = line.split('=', 1)[1].strip()
-                if speed and speed.isdigit():
-                    speeds.append(int(speed))
+        speeds = [
+            chip["Speed"] for chip in get_static_hw_info_windows().get("mem", [])
+            if isinstance(chip.get("Speed"), int)
+        ]
         
         if speeds:
             # Return the most common speed (in case of mixed RAM)
@@ -66,23 +123,12 @@ def get_ram_speed_windows():
 def get_disk_info_windows():
     """Get disk type on Windows"""
     try:
-        # Get more detailed disk info including interface type
-        result = subprocess.run(
-            ['wmic', 'diskdrive', 'get', 'model,interfacetype,mediatype', '/format:list'],
-            capture_output=True, text=True, shell=True
-        )
-        
-        disk_model = ""
-        interface_type = ""
-        media_type = ""
-        
-        for line in result.stdout.strip().split('\n'):
-            if line.startswith('Model='):
-                disk_model = line.split('=', 1)[1].strip()
-            elif line.startswith('InterfaceType='):
-                interface_type = line.split('=', 1)[1].strip()
-            elif line.startswith('MediaType='):
-                media_type = line.split('=', 1)[1].strip()
+        # Model, interface and media type of the last drive listed
+        disks = get_static_hw_info_windows().get("disk", [])
+        disk = disks[-1] if disks else {}
+        disk_model = (disk.get("Model") or "").strip()
+        interface_type = (disk.get("InterfaceType") or "").strip()
+        media_type = (disk.get("MediaType") or "").strip()
         
         # Determine disk type from model, interface, and media type
         disk_type = "HDD"
@@ -108,32 +154,48 @@ def get_disk_info_windows():
     except:
         return "Storage", ""
 
+def get_cpu_info():
+    """Get CPU brand and model for the current platform"""
+    if os.name == 'nt':  # Windows
+        return get_cpu_info_windows()
+    # Fallback for Linux/Mac
+    cpu_info_str = platform.processor()
+    brand = "AMD" if "AMD" in cpu_info_str else "Intel" if "Intel" in cpu_info_str else "Unknown"
+    return brand, cpu_info_str
+
+def get_ram_speed():
+    """Get RAM speed for the current platform"""
+    return get_ram_speed_windows() if os.name == 'nt' else "Unknown"
+
+def get_disk_info():
+    """Get disk type and model for the current platform"""
+    return get_disk_info_windows() if os.name == 'nt' else ("Storage", "")
+
 @router.get("/resources")
 async def get_system_resources() -> Dict[str, Any]:
     """Get real-time system resource usage"""
+    now = time.monotonic()
+    if _resources_cache["data"] is not None and now - _resources_cache["timestamp"] < RESOURCES_CACHE_DURATION:
+        return _resources_cache["data"]
+    
     try:
-        # CPU Information
-        cpu_usage = psutil.cpu_percent(interval=1)
-        
-        # Get CPU info based on platform
-        if os.name == 'nt':  # Windows
-            brand, model = get_cpu_info_windows()
-        else:
-            # Fallback for Linux/Mac
-            cpu_info_str = platform.processor()
-            brand = "AMD" if "AMD" in cpu_info_str else "Intel" if "Intel" in cpu_info_str else "Unknown"
-            model = cpu_info_str
+        # The hardware probes may spawn subprocesses; run them side by side
+        # off the event loop
+        (brand, model), ram_speed, (disk_type, disk_model) = await asyncio.gather(
+            asyncio.to_thread(get_cpu_info),
+            asyncio.to_thread(get_ram_speed),
+            asyncio.to_thread(get_disk_info)
+        )
         
+        # CPU Information
         cpu_info = {
-            "usage": cpu_usage,
+            "usage": psutil.cpu_percent(interval=None),
             "brand": brand,
             "model": model
         }
         
         # RAM Information
         ram = psutil.virtual_memory()
-        ram_speed = get_ram_speed_windows() if os.name == 'nt' else "Unknown"
-        
         ram_info = {
             "used_gb": ram.used / (1024**3),
             "total_gb": ram.total / (1024**3),
@@ -142,8 +204,6 @@ async def get_system_resources() -> Dict[str, Any]:
         
         # Disk Information
         disk = shutil.disk_usage('/')
-        disk_type, disk_model = get_disk_info_windows() if os.name == 'nt' else ("Storage", "")
-        
         disk_info = {
             "used_gb": disk.used / (1024**3),
             "total_gb": disk.total / (1024**3),
@@ -157,22 +217,24 @@ async def get_system_resources() -> Dict[str, Any]:
             "name": "Unknown GPU"
         }
         
-        try:
-            gpus = GPUtil.getGPUs()
-            if gpus:
-                gpu = gpus[0]  # First GPU
-                gpu_info["utilization"] = gpu.load * 100  # Convert to percentage
-                gpu_info["name"] = gpu.name
-        except:
-            pass
+        # Cached NVML handle - no nvidia-smi subprocess per poll
+        gpu = gpu_monitor.get_gpu_stats()
+        if gpu:
+            gpu_info["utilization"] = gpu['gpu_utilization'] or 0
+            gpu_info["name"] = gpu['name']
         
-        return {
+        result = {
             "cpu": cpu_info,
             "ram": ram_info,
             "disk": disk_info,
             "gpu": gpu_info
         }
         
+        _resources_cache["data"] = result
+        _resources_cache["timestamp"] = now
+        
+        return result
+        
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get system resources: {str(e)}")
 
@@ -180,18 +242,17 @@ async def get_system_resources() -> Dict[str, Any]:
 async def get_gpu_stats() -> Dict[str, Any]:
     """Get detailed GPU statistics"""
     try:
-        gpus = GPUtil.getGPUs()
-        if not gpus:
+        gpu = gpu_monitor.get_gpu_stats()
+        if not gpu:
             return {"error": "No GPU found"}
         
-        gpu = gpus[0]  # First GPU
         return {
-            "name": gpu.name,
-            "load": gpu.load * 100,  # GPU utilization percentage
-            "memory_used": gpu.memoryUsed / 1024,  # Convert to GB
-            "memory_total": gpu.memoryTotal / 1024,  # Convert to GB
-            "memory_free": gpu.memoryFree / 1024,  # Convert to GB
-            "temperature": gpu.temperature
+            "name": gpu['name'],
+            "load": gpu['gpu_utilization'],  # GPU utilization percentage
+            "memory_used": gpu['memory_used'] / 1024,  # Convert to GB
+            "memory_total": gpu['memory_total'] / 1024,  # Convert to GB
+            "memory_free": (gpu['memory_total'] - gpu['memory_used']) / 1024,  # Convert to GB
+            "temperature": gpu['temperature']
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get GPU stats: {str(e)}")
\ No newline at end of file
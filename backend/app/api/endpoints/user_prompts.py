@@ -1,5 +1,7 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, Query
+import base64
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from ...db.database import get_db
@@ -10,26 +12,48 @@ from ...schemas.user_prompt import UserPrompt, UserPromptCreate, UserPromptUpdat
 router = APIRouter()
 
 
+def encode_cursor(created_at: datetime, id: str) -> str:
+    """Opaque pagination cursor for the row (created_at, id)"""
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Inverse of encode_cursor; raises 400 on a malformed cursor"""
+    try:
+        created_at, id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), id
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
 @router.get("/", response_model=List[UserPrompt])
 def read_user_prompts(
+    response: Response,
     db: Session = Depends(get_db),
-    skip: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
     limit: int = Query(100, ge=1, le=100),
     project_id: str = None
 ) -> Any:
     """
-    Retrieve all user prompts with pagination.
+    Retrieve user prompts, newest first, with keyset pagination.
     If project_id is provided, only return prompts for that project.
+    When more prompts follow, the X-Next-Cursor header holds the cursor
+    to pass for the next page.
     """
     if project_id:
         # Check if project exists
         project = project_repository.get(db, id=project_id)
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
-        
-        user_prompts = user_prompt_repository.get_by_project(db, project_id=project_id, skip=skip, limit=limit)
-    else:
-        user_prompts = user_prompt_repository.get_multi(db, skip=skip, limit=limit)
+    
+    after = decode_cursor(cursor) if cursor else None
+    user_prompts = user_prompt_repository.get_page(db, project_id=project_id, after=after, limit=limit)
+    
+    # One extra row was fetched to detect a following page
+    if len(user_prompts) > limit:
+        user_prompts = user_prompts[:limit]
+        last = user_prompts[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(last.created_at, str(last.id))
     
     return user_prompts
 
@@ -78,23 +102,29 @@ def update_user_prompt(
     """
     Update a user prompt.
     """
-    user_prompt = user_prompt_repository.get(db, id=user_prompt_id)
-    if not user_prompt:
-        raise HTTPException(status_code=404, detail="User prompt not found")
-    
-    # Check if project exists if project_id is provided and changed
-    if user_prompt_in.project_id and user_prompt_in.project_id != user_prompt.project_id:
+    # Check if project exists if project_id is provided
+    if user_prompt_in.project_id:
         project = project_repository.get(db, id=user_prompt_in.project_id)
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
     
-    # If is_active is being set to True, deactivate other prompts for the project
-    if user_prompt_in.is_active and not user_prompt.is_active:
-        project_id = user_prompt_in.project_id or user_prompt.project_id
-        if project_id:
-            user_prompt_repository.deactivate_all_for_project(db, project_id=project_id)
+    # Activation is applied separately so sibling prompts are switched off
+    # in the same statement
+    fields = user_prompt_in.model_dump(exclude_unset=True)
+    if user_prompt_in.is_active:
+        fields.pop("is_active")
+    
+    # Existence check and update in one UPDATE ... RETURNING
+    if fields or not user_prompt_in.is_active:
+        user_prompt = user_prompt_repository.update_returning(db, id=user_prompt_id, fields=fields)
+        if not user_prompt:
+            raise HTTPException(status_code=404, detail="User prompt not found")
+    
+    if user_prompt_in.is_active:
+        user_prompt = user_prompt_repository.activate_atomic(db, prompt_id=user_prompt_id)
+        if not user_prompt:
+            raise HTTPException(status_code=404, detail="User prompt not found")
     
-    user_prompt = user_prompt_repository.update(db, db_obj=user_prompt, obj_in=user_prompt_in)
     return user_prompt
 
 
@@ -126,19 +156,8 @@ def activate_user_prompt(
     For project prompts: deactivates other prompts in the same project.
     For global prompts: deactivates all other global prompts.
     """
-    user_prompt = user_prompt_repository.get(db, id=user_prompt_id)
+    user_prompt = user_prompt_repository.activate_atomic(db, prompt_id=user_prompt_id)
     if not user_prompt:
         raise HTTPException(status_code=404, detail="User prompt not found")
     
-    if user_prompt.project_id:
-        # Project-specific prompt
-        user_prompt = user_prompt_repository.activate_prompt(
-            db, prompt_id=user_prompt_id, project_id=user_prompt.project_id
-        )
-    else:
-        # Global prompt - deactivate all other global prompts
-        user_prompt = user_prompt_repository.activate_global_prompt(
-            db, prompt_id=user_prompt_id
-        )
-    
     return user_prompt
\ No newline at end of file
@@ -0,0 +1,40 @@
+"""
+Pure-ASGI shortcut for the UI's quick status polls.
+
+The quick endpoints are polled on an interval. While their cache is fresh
+the answer is already known, so it is written straight to the socket
+without going through routing, dependency resolution and response
+validation. Everything else, and any cache miss, falls through to the app.
+"""
+from typing import Any, Dict, Mapping
+
+import orjson
+
+from app.api.endpoints.system_fast import get_fresh_cached
+
+JSON_HEADERS = [(b"content-type", b"application/json")]
+
+
+class QuickStatusInterceptor:
+    """ASGI middleware serving fresh cached payloads for a fixed set of paths"""
+
+    def __init__(self, app, caches: Mapping[str, Dict[str, Any]]):
+        self.app = app
+        self.caches = caches
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["method"] == "GET":
+            cache = self.caches.get(scope["path"])
+            if cache is not None:
+                data = get_fresh_cached(cache)
+                if data is not None:
+                    body = orjson.dumps(data)
+                    await send({
+                        "type": "http.response.start",
+                        "status": 200,
+                        "headers": JSON_HEADERS + [(b"content-length", str(len(body)).encode())],
+                    })
+                    await send({"type": "http.response.body", "body": body})
+                    return
+
+        await self.app(scope, receive, send)
@@ -1,13 +1,21 @@
+import asyncio
+import functools
+import time
 from datetime import datetime, timedelta
 from typing import Optional, Union
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.db.models import User
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+)
 
 SECRET_KEY = settings.SECRET_KEY
 ALGORITHM = "HS256"
@@ -24,6 +32,28 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+# bcrypt costs tens of milliseconds of CPU per call. The C implementation
+# releases the GIL, so async routes hand it to a worker thread instead of
+# stalling the event loop.
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against a hash without blocking the event loop."""
+    return await asyncio.to_thread(pwd_context.verify, plain_password, hashed_password)
+
+
+async def aget_password_hash(password: str) -> str:
+    """Hash a password without blocking the event loop."""
+    return await asyncio.to_thread(pwd_context.hash, password)
+
+
+async def warm_password_context() -> None:
+    """
+    Load and self-test the bcrypt backend ahead of the first login.
+    passlib does this lazily on first use, which otherwise lands on
+    whichever request happens to authenticate first in each worker.
+    """
+    await asyncio.to_thread(pwd_context.dummy_verify)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create a JWT access token."""
     to_encode = data.copy()
@@ -36,21 +66,40 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     return encoded_jwt
 
 
-def decode_access_token(token: str) -> Optional[dict]:
-    """Decode and verify a JWT access token."""
+@functools.lru_cache(maxsize=4096)
+def _decode_verified(token: str) -> Optional[dict]:
+    """Signature-checked payload of a token, memoized per token string."""
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
+        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except JWTError:
         return None
 
 
-def authenticate_user(db: Session, username: str, password: str) -> Union[User, None]:
+def decode_access_token(token: str) -> Optional[dict]:
+    """Decode and verify a JWT access token."""
+    payload = _decode_verified(token)
+    if payload is None:
+        return None
+    # The signature check is cached, expiry must still be checked every time
+    exp = payload.get("exp")
+    if exp is not None and exp <= time.time():
+        return None
+    return dict(payload)
+
+
+def get_user_by_username(db: Session, username: str) -> Optional[User]:
+    """Look up a user by username (a single probe of ix_users_username_unique)."""
+    return db.execute(
+        select(User).where(User.username == username)
+    ).scalar_one_or_none()
+
+
+async def authenticate_user(db: Session, username: str, password: str) -> Union[User, None]:
     """Authenticate a user by username and password."""
-    user = db.query(User).filter(User.username == username).first()
+    user = get_user_by_username(db, username)
     if not user:
         return None
-    if not verify_password(password, user.password_hash):
+    if not await averify_password(password, user.password_hash):
         return None
     return user
 
@@ -65,5 +114,4 @@ def get_current_user(db: Session, token: str) -> Optional[User]:
     if not username:
         return None
     
-    user = db.query(User).filter(User.username == username).first()
-    return user
\ No newline at end of file
+    return get_user_by_username(db, username)
\ No newline at end of file
@@ -2,7 +2,9 @@
 Context modes configuration that ties to chunking strategies.
 """
 
-from typing import Dict, List, Optional
+import re
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
 from enum import Enum
 
 class ContextMode(str, Enum):
@@ -12,8 +14,8 @@ class ContextMode(str, Enum):
     DEEP_RESEARCH = "deep_research"
     CUSTOM = "custom"
 
-# Context mode configurations
-CONTEXT_MODES = {
+# Context mode configurations (read-only)
+CONTEXT_MODES = MappingProxyType({
     "quick_answer": {
         "name": "Quick Answer",
         "description": "Fast responses using key facts and summaries",
@@ -61,7 +63,24 @@ CONTEXT_MODES = {
             "expand_context": True  # Get surrounding chunks
         }
     }
-}
+})
+
+# Weight given to every remaining level in deep research mode
+FALLBACK_LEVEL_WEIGHT = 0.5
+
+def _build_base_strategy(mode_config: Dict) -> Tuple[Tuple[str, float], ...]:
+    """Ordered (level, weight) pairs for a mode, highest priority first"""
+    chunk_prefs = mode_config["chunk_preferences"]
+    return (
+        (chunk_prefs["primary"], 1.0),
+        (chunk_prefs["secondary"], 0.7),
+    )
+
+# Precomputed per-mode strategies; only the availability filter runs per call
+_BASE_STRATEGIES = MappingProxyType({
+    mode: _build_base_strategy(mode_config)
+    for mode, mode_config in CONTEXT_MODES.items()
+})
 
 def get_chunk_strategy_for_mode(mode: str, available_chunks: Dict[str, List]) -> Dict:
     """
@@ -74,36 +93,30 @@ def get_chunk_strategy_for_mode(mode: str, available_chunks: Dict[str, List]) ->
     Returns:
         Search strategy configuration
     """
-    mode_config = CONTEXT_MODES.get(mode, CONTEXT_MODES["standard"])
+    if mode not in CONTEXT_MODES:
+        mode = "standard"
     
-    # Build search strategy
-    strategy = {
-        "search_levels": [],
-        "weights": {},
-        "config": mode_config["search_config"]
+    # Primary then secondary level, keeping only levels the document has
+    weights = {
+        level: weight
+        for level, weight in _BASE_STRATEGIES[mode]
+        if level in available_chunks
     }
     
-    # Determine which chunk levels to search
-    chunk_prefs = mode_config["chunk_preferences"]
-    
-    # Primary level gets highest weight
-    if chunk_prefs["primary"] in available_chunks:
-        strategy["search_levels"].append(chunk_prefs["primary"])
-        strategy["weights"][chunk_prefs["primary"]] = 1.0
-    
-    # Secondary level gets lower weight
-    if chunk_prefs["secondary"] in available_chunks:
-        strategy["search_levels"].append(chunk_prefs["secondary"])
-        strategy["weights"][chunk_prefs["secondary"]] = 0.7
-    
     # For deep research, include all available levels
     if mode == "deep_research":
         for level in available_chunks:
-            if level not in strategy["search_levels"]:
-                strategy["search_levels"].append(level)
-                strategy["weights"][level] = 0.5
+            weights.setdefault(level, FALLBACK_LEVEL_WEIGHT)
     
-    return strategy
+    return {
+        "search_levels": list(weights),
+        "weights": weights,
+        "config": CONTEXT_MODES[mode]["search_config"]
+    }
+
+# Filename keywords, matched as substrings in a single pass
+_BUSINESS_KEYWORDS_RE = re.compile("strategy|plan|report|proposal|analysis")
+_TECH_KEYWORDS_RE = re.compile("api|spec|documentation|technical")
 
 def should_create_multiple_chunks(document_type: str, filename: str) -> List[str]:
     """
@@ -111,21 +124,21 @@ def should_create_multiple_chunks(document_type: str, filename: str) -> List[str
     
     Returns list of chunk levels to create.
     """
+    filename_lower = filename.lower()
+    
     # Business documents get all sizes
-    business_keywords = ["strategy", "plan", "report", "proposal", "analysis"]
-    if any(keyword in filename.lower() for keyword in business_keywords):
+    if _BUSINESS_KEYWORDS_RE.search(filename_lower):
         return ["micro", "standard", "large", "full_section"]
     
     # Technical docs get medium sizes
-    tech_keywords = ["api", "spec", "documentation", "technical"]
-    if any(keyword in filename.lower() for keyword in tech_keywords):
+    if _TECH_KEYWORDS_RE.search(filename_lower):
         return ["standard", "large"]
     
     # Default: just standard
     return ["standard"]
 
-# Chunk level definitions
-CHUNK_LEVELS = {
+# Chunk level definitions (read-only)
+CHUNK_LEVELS = MappingProxyType({
     "micro": {
         "size": 500,
         "overlap": 100,
@@ -146,4 +159,4 @@ CHUNK_LEVELS = {
         "overlap": 3000,
         "description": "Complete sections"
     }
-}
\ No newline at end of file
+})
\ No newline at end of file
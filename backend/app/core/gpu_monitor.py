@@ -0,0 +1,117 @@
+"""
+GPU monitoring via NVML.
+Keeps one NVML session and device handle for the process lifetime instead of
+shelling out to nvidia-smi (as GPUtil does) on every probe.
+"""
+import logging
+import sys
+import threading
+from typing import Optional, Dict, Any
+
+# Import conditionally so machines without an NVIDIA driver still start
+try:
+    import pynvml
+except ImportError:
+    pynvml = None
+
+logger = logging.getLogger(__name__)
+
+_gpu_handle = None
+_gpu_name: Optional[str] = None
+_nvml_failed = False
+_nvml_lock = threading.Lock()
+
+def get_gpu_handle():
+    """Return the NVML handle for GPU 0, initialising NVML on first use"""
+    global _gpu_handle, _nvml_failed
+    if _gpu_handle is not None or _nvml_failed or pynvml is None:
+        return _gpu_handle
+    
+    with _nvml_lock:
+        if _gpu_handle is None and not _nvml_failed:
+            try:
+                pynvml.nvmlInit()
+                _gpu_handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+            except pynvml.NVMLError as e:
+                # No driver or no device - don't retry on every probe
+                logger.warning(f"NVML unavailable, GPU monitoring disabled: {e}")
+                _nvml_failed = True
+    return _gpu_handle
+
+def get_gpu_name(handle) -> str:
+    """Return the device name; it never changes, so it is looked up once"""
+    global _gpu_name
+    if _gpu_name is None:
+        name = pynvml.nvmlDeviceGetName(handle)
+        _gpu_name = name.decode() if isinstance(name, bytes) else name
+    return _gpu_name
+
+def get_gpu_memory():
+    """Return NVML memory info (total/used/free in bytes) for GPU 0, or None"""
+    handle = get_gpu_handle()
+    if handle is None:
+        return None
+    try:
+        return pynvml.nvmlDeviceGetMemoryInfo(handle)
+    except pynvml.NVMLError as e:
+        logger.warning(f"NVML query failed: {e}")
+        return None
+
+def _torch_gpu_stats() -> Optional[Dict[str, Any]]:
+    """
+    Fallback when NVML is unavailable: read GPU 0 through torch.cuda, but only
+    if torch is already loaded - importing it here would pull in the CUDA runtime.
+    Utilization and temperature are not exposed by torch.
+    """
+    torch = sys.modules.get("torch")
+    if torch is None or not torch.cuda.is_available():
+        return None
+    try:
+        free, total = torch.cuda.mem_get_info(0)
+        return {
+            'name': torch.cuda.get_device_name(0),
+            'memory_total': round(total / 1024 / 1024),
+            'memory_used': round((total - free) / 1024 / 1024),
+            'gpu_utilization': None,
+            'temperature': None
+        }
+    except RuntimeError as e:
+        logger.warning(f"torch.cuda query failed: {e}")
+        return None
+
+def get_gpu_stats() -> Optional[Dict[str, Any]]:
+    """Return name, memory (MB), utilization and temperature of GPU 0"""
+    handle = get_gpu_handle()
+    if handle is None:
+        return _torch_gpu_stats()
+    
+    try:
+        memory = pynvml.nvmlDeviceGetMemoryInfo(handle)
+        utilization = pynvml.nvmlDeviceGetUtilizationRates(handle)
+        name = get_gpu_name(handle)
+        try:
+            temperature = pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
+        except pynvml.NVMLError:
+            temperature = None
+    except pynvml.NVMLError as e:
+        logger.warning(f"NVML query failed: {e}")
+        return None
+    
+    return {
+        'name': name,
+        'memory_total': round(memory.total / 1024 / 1024),
+        'memory_used': round(memory.used / 1024 / 1024),
+        'gpu_utilization': utilization.gpu,
+        'temperature': temperature
+    }
+
+def shutdown():
+    """Release the NVML session; called on application shutdown"""
+    global _gpu_handle
+    if _gpu_handle is None:
+        return
+    try:
+        pynvml.nvmlShutdown()
+    except pynvml.NVMLError as e:
+        logger.warning(f"NVML shutdown failed: {e}")
+    _gpu_handle = None
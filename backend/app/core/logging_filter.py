@@ -3,7 +3,9 @@ Logging filter to suppress resource monitoring spam
 """
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import re
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 # Create log directory if it doesn't exist
 log_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'logs')
@@ -18,25 +20,46 @@ resource_handler = RotatingFileHandler(
 resource_handler.setLevel(logging.INFO)
 resource_handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
 
+# Suppressed records are queued and written by a background listener, so the
+# filter never blocks the request path on a file write
+resource_queue = queue.Queue(-1)
+resource_logger = logging.getLogger('resource_monitoring')
+resource_logger.addHandler(QueueHandler(resource_queue))
+resource_logger.setLevel(logging.INFO)
+resource_logger.propagate = False
+resource_listener = QueueListener(resource_queue, resource_handler)
+_listener_running = False
+
+def start_resource_logging():
+    """Start the background writer for resource monitoring records"""
+    global _listener_running
+    if not _listener_running:
+        resource_listener.start()
+        _listener_running = True
+
+def stop_resource_logging():
+    """Flush queued resource monitoring records and stop the writer"""
+    global _listener_running
+    if _listener_running:
+        resource_listener.stop()
+        _listener_running = False
+
+# Resource monitoring endpoints polled by the UI
+SUPPRESSED_ENDPOINTS_PATTERN = re.compile(
+    r'/api/(?:models/status/quick|system/resources|models/memory|system/gpu-stats)'
+)
+
 class ResourceEndpointFilter(logging.Filter):
     """Filter out resource monitoring endpoints from console"""
     
     def filter(self, record):
-        # List of endpoints to suppress
-        suppressed_endpoints = [
-            '/api/models/status/quick',
-            '/api/system/resources',
-            '/api/models/memory',
-            '/api/system/gpu-stats'
-        ]
-        
-        message = record.getMessage()
+        # Only access log lines can name an endpoint
+        if record.name != 'uvicorn.access':
+            return True
         
-        # Check if this message contains any suppressed endpoints
-        for endpoint in suppressed_endpoints:
-            if endpoint in message:
-                # Log to file instead of console
-                resource_handler.emit(record)
-                return False  # Don't show in console
+        if SUPPRESSED_ENDPOINTS_PATTERN.search(record.getMessage()):
+            # Log to file instead of console
+            resource_logger.handle(record)
+            return False  # Don't show in console
         
         return True  # Show in console
\ No newline at end of file
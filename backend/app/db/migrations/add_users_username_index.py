@@ -0,0 +1,37 @@
+"""
+Migration to add a unique index on users.username
+
+Login and every authenticated request look users up by username, so the
+lookup must be a single index probe rather than a table scan.
+"""
+from sqlalchemy import create_engine, text
+from app.core.config import settings
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def upgrade():
+    """Create the unique username index"""
+    engine = create_engine(settings.DATABASE_URL)
+    
+    with engine.connect() as conn:
+        conn.execute(text("""
+            CREATE UNIQUE INDEX IF NOT EXISTS ix_users_username_unique 
+            ON users(username);
+        """))
+        
+        conn.commit()
+        logger.info("Successfully created ix_users_username_unique")
+
+def downgrade():
+    """Drop the unique username index"""
+    engine = create_engine(settings.DATABASE_URL)
+    
+    with engine.connect() as conn:
+        conn.execute(text("DROP INDEX IF EXISTS ix_users_username_unique;"))
+        conn.commit()
+        logger.info("Successfully dropped ix_users_username_unique")
+
+if __name__ == "__main__":
+    upgrade()
\ No newline at end of file
@@ -4,7 +4,9 @@ Repository for System Prompt CRUD operations
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import select, update, delete
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import SQLAlchemyError
 
 from app.db.models.system_prompt import SystemPrompt
 from app.db.repositories.base_repository import BaseRepository
@@ -46,6 +48,54 @@ class SystemPromptRepository(BaseRepository[SystemPrompt, SystemPromptCreate, Sy
         db.refresh(prompt)
         return prompt
     
+    def get_flags(self, db: Session, prompt_id: UUID) -> Optional[Row]:
+        """Get just (is_default, is_active) for a prompt, None if it doesn't exist"""
+        stmt = select(SystemPrompt.is_default, SystemPrompt.is_active).where(
+            SystemPrompt.id == prompt_id
+        )
+        return db.execute(stmt).first()
+    
+    def update_if_mutable(self, db: Session, prompt_id: UUID, fields: Dict[str, Any]) -> Optional[SystemPrompt]:
+        """
+        Update a non-default prompt with a single UPDATE ... RETURNING.
+        Returns None if no row matched (missing or default prompt).
+        """
+        condition = (SystemPrompt.id == prompt_id) & (SystemPrompt.is_default == False)
+        if not fields:
+            return db.execute(select(SystemPrompt).where(condition)).scalar_one_or_none()
+        
+        stmt = update(SystemPrompt).where(condition).values(**fields).returning(SystemPrompt)
+        try:
+            prompt = db.execute(stmt).scalar_one_or_none()
+            # RETURNING already loaded every column (including the trigger-set
+            # updated_at); detach so the commit doesn't expire it and force a
+            # reload when the response is serialized
+            if prompt is not None:
+                db.expunge(prompt)
+            db.commit()
+            return prompt
+        except SQLAlchemyError as e:
+            db.rollback()
+            raise e
+    
+    def remove_if_mutable(self, db: Session, prompt_id: UUID) -> bool:
+        """
+        Delete a prompt unless it is a default or the active one, in one
+        DELETE ... RETURNING. Returns whether a row was deleted.
+        """
+        stmt = delete(SystemPrompt).where(
+            SystemPrompt.id == prompt_id,
+            SystemPrompt.is_default == False,
+            SystemPrompt.is_active == False
+        ).returning(SystemPrompt.id)
+        try:
+            deleted = db.execute(stmt).first() is not None
+            db.commit()
+            return deleted
+        except SQLAlchemyError as e:
+            db.rollback()
+            raise e
+    
     def deactivate_all(self, db: Session) -> None:
         """Deactivate all system prompts"""
         stmt = select(SystemPrompt).where(SystemPrompt.is_active == True)
@@ -112,13 +162,16 @@ Format code with proper syntax highlighting. Default to modern, idiomatic approa
             }
         ]
         
+        # Which defaults already exist - names only, one query served by the
+        # UNIQUE index on name, no ORM objects hydrated
+        existing_names = set(db.execute(
+            select(SystemPrompt.name).where(
+                SystemPrompt.name.in_([prompt_data["name"] for prompt_data in default_prompts])
+            )
+        ).scalars())
+        
         for prompt_data in default_prompts:
-            # Check if prompt already exists
-            existing = db.query(SystemPrompt).filter(
-                SystemPrompt.name == prompt_data["name"]
-            ).first()
-            
-            if not existing:
+            if prompt_data["name"] not in existing_names:
                 prompt = SystemPrompt(**prompt_data)
                 db.add(prompt)
                 created_prompts.append(prompt)
@@ -1,4 +1,6 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import exists, select, update, or_, tuple_
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -23,74 +25,91 @@ class UserPromptRepository(BaseRepository[UserPrompt, UserPromptCreate, UserProm
             db.rollback()
             raise e
     
-    def get_active_for_project(self, db: Session, project_id: str) -> Optional[UserPrompt]:
-        """Get the active user prompt for a project, if any."""
+    def get_page(
+        self, db: Session, *, project_id: Optional[str] = None,
+        after: Optional[Tuple[datetime, str]] = None, limit: int = 100
+    ) -> List[UserPrompt]:
+        """
+        Keyset-paginated prompts, newest first. `after` is the (created_at, id)
+        of the last row of the previous page. Returns up to limit + 1 rows so
+        the caller can tell whether another page follows without a COUNT.
+        """
         try:
-            return db.query(UserPrompt).filter(
-                UserPrompt.project_id == project_id,
-                UserPrompt.is_active == True
-            ).first()
+            query = db.query(UserPrompt)
+            if project_id:
+                query = query.filter(UserPrompt.project_id == project_id)
+            if after:
+                query = query.filter(tuple_(UserPrompt.created_at, UserPrompt.id) < tuple_(*after))
+            return query.order_by(
+                UserPrompt.created_at.desc(), UserPrompt.id.desc()
+            ).limit(limit + 1).all()
         except SQLAlchemyError as e:
             db.rollback()
             raise e
     
-    def activate_prompt(self, db: Session, prompt_id: str, project_id: str) -> UserPrompt:
+    def update_returning(self, db: Session, id: str, fields: Dict[str, Any]) -> Optional[UserPrompt]:
         """
-        Activate a prompt for a project and deactivate all others.
+        Update a prompt in a single UPDATE ... RETURNING, without loading it
+        first. Returns None if no prompt has that id.
         """
+        if not fields:
+            return self.get(db, id=id)
         try:
-            # Deactivate all prompts for the project
-            db.query(UserPrompt).filter(
-                UserPrompt.project_id == project_id,
-                UserPrompt.is_active == True
-            ).update({"is_active": False})
-            
-            # Activate the requested prompt
-            prompt = db.query(UserPrompt).filter(UserPrompt.id == prompt_id).first()
-            prompt.is_active = True
-            
+            prompt = db.execute(
+                update(UserPrompt).where(UserPrompt.id == id).values(**fields).returning(UserPrompt)
+            ).scalar_one_or_none()
+            # Every column came back with RETURNING; detach so the commit does
+            # not expire it and trigger a reload during serialization
+            if prompt is not None:
+                db.expunge(prompt)
             db.commit()
-            db.refresh(prompt)
             return prompt
         except SQLAlchemyError as e:
             db.rollback()
             raise e
     
-    def deactivate_all_for_project(self, db: Session, project_id: str) -> None:
-        """
-        Deactivate all prompts for a project.
-        """
+    def get_active_for_project(self, db: Session, project_id: str) -> Optional[UserPrompt]:
+        """Get the active user prompt for a project, if any."""
         try:
-            db.query(UserPrompt).filter(
+            return db.query(UserPrompt).filter(
                 UserPrompt.project_id == project_id,
                 UserPrompt.is_active == True
-            ).update({"is_active": False})
-            db.commit()
+            ).first()
         except SQLAlchemyError as e:
             db.rollback()
             raise e
     
-    def activate_global_prompt(self, db: Session, prompt_id: str) -> UserPrompt:
+    def activate_atomic(self, db: Session, prompt_id: str) -> Optional[UserPrompt]:
         """
-        Activate a global prompt and deactivate all other global prompts.
+        Activate a prompt and deactivate the others in its scope - the same
+        project, or all global prompts for a global one - in one UPDATE.
+        Returns None if no prompt has that id.
         """
+        scope = select(UserPrompt.project_id).where(UserPrompt.id == prompt_id).scalar_subquery()
+        stmt = (
+            update(UserPrompt)
+            .where(
+                # Without the target row the scope is NULL, which would
+                # otherwise match (and deactivate) the global prompts
+                exists(select(UserPrompt.id).where(UserPrompt.id == prompt_id)),
+                UserPrompt.project_id.is_not_distinct_from(scope),
+                or_(UserPrompt.is_active == True, UserPrompt.id == prompt_id)
+            )
+            .values(is_active=(UserPrompt.id == prompt_id))
+            .returning(UserPrompt)
+            .execution_options(synchronize_session=False)
+        )
         try:
-            # Deactivate all global prompts (where project_id is None)
-            db.query(UserPrompt).filter(
-                UserPrompt.project_id == None,
-                UserPrompt.is_active == True
-            ).update({"is_active": False})
-            
-            # Activate the requested prompt
-            prompt = db.query(UserPrompt).filter(UserPrompt.id == prompt_id).first()
-            prompt.is_active = True
-            
+            prompt = next((p for p in db.execute(stmt).scalars() if str(p.id) == str(prompt_id)), None)
+            if prompt is None:
+                # Target vanished (e.g. deleted concurrently); change nothing
+                db.rollback()
+                return None
+            db.expunge(prompt)
             db.commit()
-            db.refresh(prompt)
             return prompt
         except SQLAlchemyError as e:
             db.rollback()
             raise e
 
-
 user_prompt_repository = UserPromptRepository()
\ No newline at end of file
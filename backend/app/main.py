@@ -1,6 +1,6 @@
 from fastapi import FastAPI, UploadFile, File, Form, Depends, BackgroundTasks, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from sqlalchemy.orm import Session
 import os
 import sys
@@ -10,20 +10,22 @@ from typing import Optional, List, Dict, Any
 from contextlib import asynccontextmanager
 
 from app.api.api import api_router
+from app.api.endpoints import system as system_endpoints
+from app.api.endpoints import system_fast
+from app.api.health_interceptor import QuickStatusInterceptor
 from app.db.database import Base, engine, get_db
 from app.document_processing.status_tracker import status_tracker
-from app.core.logging_filter import ResourceEndpointFilter
+from app.core.logging_filter import ResourceEndpointFilter, start_resource_logging, stop_resource_logging
 from app.services.model_orchestrator import orchestrator
 from app.core.config import get_settings
+from app.core.auth import warm_password_context
+from app.core import gpu_monitor
 import logging
 
 # Set up logging filter to suppress resource polling
 logging.getLogger("uvicorn.access").addFilter(ResourceEndpointFilter())
 logger = logging.getLogger(__name__)
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
-
 # NeMo integration is handled via Docker container and HTTP API
 # Chat endpoints use nemo_docker_client.py for communication
 print("Using NeMo Docker container for AI inference")
@@ -39,6 +41,14 @@ async def lifespan(app: FastAPI):
     """
     # Startup
     logger.info("Starting up AI Assistant...")
+    start_resource_logging()
+    
+    # Create database tables (once per startup, not on every import)
+    if settings.CREATE_TABLES_ON_STARTUP:
+        Base.metadata.create_all(bind=engine)
+    
+    # Warm the bcrypt backend in a worker thread while the models load
+    password_warmup = asyncio.create_task(warm_password_context())
     
     # Load default model on startup
     try:
@@ -68,17 +78,39 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Error loading embeddings model: {e}")
     
+    # Start background system monitoring (Ollama model list refresh)
+    await system_endpoints.start_background_tasks()
+    await password_warmup
+    
     yield
     
     # Shutdown
     logger.info("Shutting down AI Assistant...")
+    await system_endpoints.stop_background_tasks()
+    gpu_monitor.shutdown()
+    # Close pooled database connections so reloads don't leak sockets
+    engine.dispose()
+    stop_resource_logging()
     # Models stay in VRAM even after shutdown unless explicitly unloaded
 
 app = FastAPI(
     title="AI Assistant API",
     description="FastAPI backend for AI Assistant with project-centered containment",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson serializes the continuously polled status payloads several
+    # times faster than the stdlib encoder
+    default_response_class=ORJSONResponse
+)
+
+# Answer the UI's quick status polls from cache before routing. Added
+# before CORS so CORS still wraps it and adds its headers.
+app.add_middleware(
+    QuickStatusInterceptor,
+    caches={
+        "/api/system/active-model-quick": system_fast._model_status_cache,
+        "/api/system/vram-usage-quick": system_fast._vram_cache,
+    },
 )
 
 # Add CORS middleware to allow frontend to connect
@@ -88,6 +120,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # keyset pagination cursor
 )
 
 # Check if we're using NeMo
@@ -3,13 +3,20 @@ File Reader Service for Self-Aware Mode
 Provides safe file system access for the AI assistant to read its own codebase
 """
 import os
+import stat
 import logging
-from typing import List, Dict, Optional, Union
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Optional, Tuple, Union
 from pathlib import Path
 import mimetypes
 
 logger = logging.getLogger(__name__)
 
+def _translate_newlines(text: str) -> str:
+    """Match the universal-newline translation Path.read_text applies"""
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
 class FileReaderService:
     """Service for reading files in the assistant's codebase"""
     
@@ -25,6 +32,12 @@ class FileReaderService:
             'node_modules', '__pycache__', '.git', 'venv', 'venv_nemo', 
             '.pytest_cache', 'dist', 'build', '.next', 'coverage'
         }
+        # path -> ((mtime_ns, size), text, encoding), least recently used first
+        self.text_cache_size = 256
+        self.text_cache_max_chars = 32 * 1024 * 1024
+        self._text_cache_chars = 0
+        self._text_cache: "OrderedDict[str, Tuple[Tuple[int, int], str, Optional[str]]]" = OrderedDict()
+        self._text_cache_lock = threading.Lock()
     
     def is_safe_path(self, path: Path) -> bool:
         """Check if a path is safe to access"""
@@ -86,14 +99,17 @@ class FileReaderService:
                     "success": False
                 }
             
-            if not full_path.exists():
+            # One stat answers existence, type and size
+            try:
+                file_stat = full_path.stat()
+            except FileNotFoundError:
                 return {
                     "content": "",
                     "error": f"File not found: {file_path}",
                     "success": False
                 }
             
-            if not full_path.is_file():
+            if not stat.S_ISREG(file_stat.st_mode):
                 return {
                     "content": "",
                     "error": f"Not a file: {file_path}",
@@ -101,7 +117,7 @@ class FileReaderService:
                 }
             
             # Check file size
-            file_size = full_path.stat().st_size
+            file_size = file_stat.st_size
             if file_size > self.max_file_size:
                 return {
                     "content": "",
@@ -117,41 +133,24 @@ class FileReaderService:
                     "success": False
                 }
             
-            # Read the file
-            try:
-                content = full_path.read_text(encoding='utf-8')
-                
-                # Limit lines if requested
-                if max_lines:
-                    lines = content.split('\n')
-                    if len(lines) > max_lines:
-                        content = '\n'.join(lines[:max_lines])
-                        content += f"\n\n... (truncated at {max_lines} lines)"
-                
-                return {
-                    "content": content,
-                    "path": file_path,
-                    "size": file_size,
-                    "success": True
-                }
-                
-            except UnicodeDecodeError:
-                # Try with different encoding
-                try:
-                    content = full_path.read_text(encoding='latin-1')
-                    return {
-                        "content": content,
-                        "path": file_path,
-                        "size": file_size,
-                        "encoding": "latin-1",
-                        "success": True
-                    }
-                except Exception as e:
-                    return {
-                        "content": "",
-                        "error": f"Failed to decode file: {str(e)}",
-                        "success": False
-                    }
+            content, encoding = self._load_text(full_path, (file_stat.st_mtime_ns, file_size))
+            
+            # Limit lines if requested
+            if max_lines:
+                lines = content.split('\n')
+                if len(lines) > max_lines:
+                    content = '\n'.join(lines[:max_lines])
+                    content += f"\n\n... (truncated at {max_lines} lines)"
+            
+            result = {
+                "content": content,
+                "path": file_path,
+                "size": file_size,
+                "success": True
+            }
+            if encoding:
+                result["encoding"] = encoding
+            return result
                     
         except Exception as e:
             logger.error(f"Error reading file {file_path}: {e}")
@@ -161,6 +160,39 @@ class FileReaderService:
                 "success": False
             }
     
+    def _load_text(self, full_path: Path, signature: Tuple[int, int]) -> Tuple[str, Optional[str]]:
+        """
+        Decoded text of a file and the fallback encoding used, if any.
+        Chat keeps asking about the same files, so the text is kept in a small
+        LRU and reused until the file's (mtime, size) signature changes.
+        """
+        key = str(full_path)
+        with self._text_cache_lock:
+            cached = self._text_cache.get(key)
+            if cached is not None and cached[0] == signature:
+                self._text_cache.move_to_end(key)
+                return cached[1], cached[2]
+        
+        # Read the file once; the latin-1 fallback decodes the same bytes
+        raw = full_path.read_bytes()
+        try:
+            content, encoding = _translate_newlines(raw.decode('utf-8')), None
+        except UnicodeDecodeError:
+            content, encoding = _translate_newlines(raw.decode('latin-1')), 'latin-1'
+        
+        with self._text_cache_lock:
+            stale = self._text_cache.pop(key, None)
+            if stale is not None:
+                self._text_cache_chars -= len(stale[1])
+            self._text_cache[key] = (signature, content, encoding)
+            self._text_cache_chars += len(content)
+            # Evict oldest entries by count and by total cached text
+            while (len(self._text_cache) > self.text_cache_size
+                   or self._text_cache_chars > self.text_cache_max_chars):
+                _, evicted = self._text_cache.popitem(last=False)
+                self._text_cache_chars -= len(evicted[1])
+        return content, encoding
+    
     def search_in_files(self, search_term: str, file_pattern: Optional[str] = None, 
                        max_results: int = 20) -> List[Dict[str, Union[str, int]]]:
         """Search for a term in the codebase"""